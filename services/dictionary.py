@@ -1,27 +1,124 @@
 import json
 import os
+import sys
 import csv
 import re
+import time
+import heapq
+import threading
+import functools
+import atexit
+import numpy as np
+from operator import attrgetter, itemgetter
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Callable
 from utils.logger import Logger
 
+try:
+    import orjson
+except ImportError:  # orjsonが無い環境では標準のjsonで代替
+    orjson = None
+
+# ソート・上位抽出で使うキー関数（C実装のattrgetterで属性を取り出す）
+_PRIORITY_KEY = attrgetter("priority")
+_CREATED_AT_KEY = attrgetter("created_at")
+_PRIORITY_USAGE_KEY = attrgetter("priority", "usage_count")
+_CATEGORY_KEY = attrgetter("category")
+_READING_KEY = attrgetter("reading")
+
+# 高度な検索で文字列の列をソートする際のキー関数
+_TEXT_SORT_KEYS = {
+    "created_at": _CREATED_AT_KEY,
+    "reading": _READING_KEY,
+    "display": attrgetter("display"),
+}
+
+def _synchronized(method):
+    """DictionaryServiceのロックを取得してからメソッドを実行するデコレータ
+    
+    辞書ウィンドウのファイル処理スレッドと文字起こしスレッドから同時に呼ばれるため、
+    エントリを変更・走査するメソッドに付与する
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+def _read_json(file_path: str) -> Dict:
+    """JSONファイルを読み込む（orjsonが利用可能な場合は高速に処理）"""
+    if orjson is not None:
+        return orjson.loads(Path(file_path).read_bytes())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(file_path: str, data: Dict):
+    """JSONファイルに書き込む（orjsonが利用可能な場合は高速に処理）
+    
+    一時ファイルに書き出してから置き換えるため、書き込み途中で中断されても元のファイルは壊れない
+    """
+    temp_path = f"{file_path}.tmp"
+    try:
+        if orjson is not None:
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
 class DictionaryEntry:
     """辞書エントリを表すクラス"""
     
+    # 大量のエントリを保持するため、インスタンスごとの__dict__を持たせない
+    __slots__ = (
+        "id", "reading", "display", "category", "priority", "notes",
+        "usage_count", "created_at", "updated_at", "last_used",
+        "_reading_lc", "_display_lc", "_notes_lc"
+    )
+    
     def __init__(self, reading: str, display: str, category: str = "その他", 
-                 priority: int = 50, notes: str = "", entry_id: Optional[str] = None):
+                 priority: int = 50, notes: str = "", entry_id: Optional[str] = None,
+                 now: Optional[str] = None):
         self.id = entry_id or self._generate_id()
         self.reading = reading.strip()
         self.display = display.strip()
-        self.category = category
+        self.category = sys.intern(category)  # カテゴリ名は種類が少ないため共有して比較を高速化
         self.priority = priority
         self.notes = notes
         self.usage_count = 0
-        self.created_at = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        # 一括作成時は呼び出し側で取得済みの現在時刻を使い回す
+        now = now or datetime.now().isoformat()
+        self.created_at = now
+        self.updated_at = now
         self.last_used: Optional[str] = None
+        self._update_search_keys()
+    
+    def _update_search_keys(self):
+        """検索用に小文字化した読み・表記・備考をキャッシュ"""
+        self._reading_lc = self.reading.lower()
+        self._display_lc = self.display.lower()
+        self._notes_lc = self.notes.lower()
+    
+    def matches_text(self, query_lower: str) -> bool:
+        """小文字化済みの検索文字列が読み・表記・備考のいずれかに含まれるか"""
+        return (query_lower in self._reading_lc or
+                query_lower in self._display_lc or
+                query_lower in self._notes_lc)
+    
+    def update_fields(self, reading: str, display: str, category: str, priority: int, notes: str):
+        """編集内容を反映（検索用のキャッシュも更新する）"""
+        self.reading = reading.strip()
+        self.display = display.strip()
+        self.category = sys.intern(category)
+        self.priority = priority
+        self.notes = notes
+        self._update_search_keys()
     
     def _generate_id(self) -> str:
         """一意のIDを生成"""
@@ -45,26 +142,42 @@ class DictionaryEntry:
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'DictionaryEntry':
-        """辞書形式から復元"""
-        entry = cls(
-            reading=data["reading"],
-            display=data["display"],
-            category=data.get("category", "その他"),
-            priority=data.get("priority", 50),
-            notes=data.get("notes", ""),
-            entry_id=data.get("id")
-        )
-        entry.usage_count = data.get("usage_count", 0)
-        entry.created_at = data.get("created_at", entry.created_at)
-        entry.updated_at = data.get("updated_at", entry.updated_at)
-        entry.last_used = data.get("last_used")
+        """辞書形式から復元
+        
+        辞書読み込み時に大量に呼ばれるため、__init__を経由せずに属性を直接設定する
+        （保存済みの日時を上書きするだけの現在時刻取得を省く）
+        """
+        get = data.get
+        entry = cls.__new__(cls)
+        entry.id = get("id") or entry._generate_id()
+        entry.reading = data["reading"].strip()
+        entry.display = data["display"].strip()
+        # nullで保存されたカテゴリ・備考のみ既定値として扱う（空文字列はそのまま残す）
+        category = get("category")
+        entry.category = sys.intern("その他" if category is None else category)
+        entry.priority = get("priority", 50)
+        notes = get("notes")
+        entry.notes = "" if notes is None else notes
+        entry.usage_count = get("usage_count", 0)
+        
+        # 日時が欠けている古いデータの場合のみ現在時刻で補う
+        if "created_at" in data and "updated_at" in data:
+            entry.created_at = data["created_at"]
+            entry.updated_at = data["updated_at"]
+        else:
+            now = datetime.now().isoformat()
+            entry.created_at = get("created_at", now)
+            entry.updated_at = get("updated_at", now)
+        entry.last_used = get("last_used")
+        entry._update_search_keys()
         return entry
     
-    def update_usage(self):
+    def update_usage(self, now: Optional[str] = None):
         """使用実績を更新"""
+        now = now or datetime.now().isoformat()
         self.usage_count += 1
-        self.last_used = datetime.now().isoformat()
-        self.updated_at = datetime.now().isoformat()
+        self.last_used = now
+        self.updated_at = now
 
 class CategoryManager:
     """カテゴリ管理クラス"""
@@ -88,32 +201,51 @@ class CategoryManager:
         }
     }
     
+    # カテゴリごとのパターンを1つの正規表現にまとめてプリコンパイル（表記を1回走査するだけで判定）
+    _PATTERN_RES = {
+        category: re.compile("|".join(map(re.escape, patterns["patterns"])))
+        for category, patterns in AUTO_CATEGORY_PATTERNS.items()
+        if "patterns" in patterns
+    }
+    
+    # カテゴリごとのサフィックスをタプル化（str.endswithに一度で渡せる）
+    _SUFFIX_TUPLES = {
+        category: tuple(patterns["suffixes"])
+        for category, patterns in AUTO_CATEGORY_PATTERNS.items()
+        if "suffixes" in patterns
+    }
+    
+    # 利用可能なカテゴリ一覧（パターン定義から一度だけ作成）
+    _AVAILABLE_CATEGORIES = tuple(AUTO_CATEGORY_PATTERNS) + ("その他",)
+    
     @classmethod
     def predict_category(cls, reading: str, display: str) -> str:
         """読みと表記からカテゴリを推定"""
-        for category, patterns in cls.AUTO_CATEGORY_PATTERNS.items():
+        for category in cls.AUTO_CATEGORY_PATTERNS:
             # サフィックスチェック
-            if "suffixes" in patterns:
-                for suffix in patterns["suffixes"]:
-                    if display.endswith(suffix):
-                        return category
+            suffixes = cls._SUFFIX_TUPLES.get(category)
+            if suffixes is not None and display.endswith(suffixes):
+                return category
             
             # パターンチェック
-            if "patterns" in patterns:
-                for pattern in patterns["patterns"]:
-                    if pattern in display:
-                        return category
+            pattern_re = cls._PATTERN_RES.get(category)
+            if pattern_re is not None and pattern_re.search(display):
+                return category
         
         return "その他"
     
     @classmethod
     def get_available_categories(cls) -> List[str]:
-        """利用可能なカテゴリ一覧を取得"""
-        return list(cls.AUTO_CATEGORY_PATTERNS.keys()) + ["その他"]
+        """利用可能なカテゴリ一覧を取得（呼び出し側で変更できるようコピーを返す）"""
+        return list(cls._AVAILABLE_CATEGORIES)
 
 class PriorityManager:
     """優先度管理クラス"""
     
+    # 一般的な名前（含まれる場合に優先度ボーナスを付与）
+    _COMMON_NAMES = frozenset(["田中", "佐藤", "山田", "高橋", "渡辺", "東京", "大阪", "名古屋"])
+    _COMMON_NAME_RE = re.compile("|".join(map(re.escape, sorted(_COMMON_NAMES))))
+    
     @classmethod
     def calculate_auto_priority(cls, reading: str, display: str, usage_count: int = 0) -> int:
         """自動優先度計算"""
@@ -134,12 +266,19 @@ class PriorityManager:
     @classmethod
     def _get_common_name_bonus(cls, display: str) -> int:
         """一般的な名前のボーナス計算"""
-        common_names = ["田中", "佐藤", "山田", "高橋", "渡辺", "東京", "大阪", "名古屋"]
-        return 10 if any(name in display for name in common_names) else 0
+        # 表記が名前そのものなら集合の検索のみで判定し、それ以外は部分一致を1回の走査で判定
+        if display in cls._COMMON_NAMES or cls._COMMON_NAME_RE.search(display):
+            return 10
+        return 0
 
 class DictionaryService:
     """固有名詞辞書サービス"""
     
+    # 使用実績の更新を保存するまでの待ち時間（秒）。この間の更新は1回の保存にまとめる
+    SAVE_DELAY = 10.0
+    # CSVインポートの進捗を通知する間隔（行数）
+    IMPORT_PROGRESS_INTERVAL = 500
+    
     def __init__(self, dictionary_dir: str = "data/dictionaries"):
         self.logger = Logger.get_logger(__name__)
         self.dictionary_dir = Path(dictionary_dir)
@@ -148,6 +287,33 @@ class DictionaryService:
         self.entries: Dict[str, List[DictionaryEntry]] = {}  # reading -> [entries]
         self.enabled = True
         self.current_file: Optional[str] = None
+        # 複数スレッドからの操作を直列化するロック（再入可能）
+        self._lock = threading.RLock()
+        
+        # 全エントリの一覧（変更時に破棄して遅延再構築）
+        self._all_entries: Optional[List[DictionaryEntry]] = None
+        # カテゴリ・優先度順に並べた全エントリの一覧（変更時に破棄して遅延再構築）
+        self._sorted_entries: Optional[List[DictionaryEntry]] = None
+        # 高度な検索用の列指向データ（変更時に破棄して遅延再構築）
+        self._search_columns: Optional[Dict] = None
+        # カテゴリ別の集計（変更時に破棄して遅延再構築）
+        self._category_index: Optional[Dict[str, Dict]] = None
+        # 表記の先頭文字ごとのエントリ索引（変更時に破棄して遅延再構築）
+        self._display_index: Optional[Dict[str, List[Tuple[int, DictionaryEntry]]]] = None
+        # 詳細な統計情報（変更時に破棄して遅延再構築）
+        self._detailed_statistics: Optional[Dict] = None
+        # 辞書の内容が変わるたびに増える版数（外部のキャッシュの有効判定に使う）
+        self._revision = 0
+        
+        # 連続更新時に使い回す現在時刻（ISO形式）とその取得時刻
+        self._now_ts = 0.0
+        self._now_iso = ""
+        
+        # 未保存の変更の有無と、遅延保存用のタイマー
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+        # 終了時に未保存の変更を書き出す
+        atexit.register(self.flush)
         
         # デフォルト辞書の読み込み
         self.load_default_dictionary()
@@ -179,6 +345,7 @@ class DictionaryService:
         self.current_file = str(default_file)
         self.logger.info(f"デフォルト辞書を作成しました: {default_file}")
     
+    @_synchronized
     def add_entry(self, entry: DictionaryEntry) -> bool:
         """エントリを追加"""
         try:
@@ -191,10 +358,9 @@ class DictionaryService:
                     self.logger.warning(f"同じエントリが既に存在します: {entry.reading} -> {entry.display}")
                     return False
             
-            self.entries[entry.reading].append(entry)
-            
-            # 優先度順にソート
-            self.entries[entry.reading].sort(key=lambda x: x.priority, reverse=True)
+            # 優先度順を保ったまま挿入
+            self._insert_by_priority(self.entries[entry.reading], entry)
+            self._invalidate_caches()
             
             self.logger.info(f"エントリを追加しました: {entry.reading} -> {entry.display}")
             return True
@@ -203,6 +369,7 @@ class DictionaryService:
             self.logger.error(f"エントリ追加中にエラーが発生しました: {str(e)}")
             return False
     
+    @_synchronized
     def update_entry(self, old_reading: str, old_display: str, updated_entry: DictionaryEntry) -> bool:
         """エントリを更新"""
         try:
@@ -240,6 +407,7 @@ class DictionaryService:
             self.logger.error(f"エントリ更新中にエラーが発生しました: {str(e)}")
             return False
     
+    @_synchronized
     def remove_entry(self, reading: str, display: str) -> bool:
         """エントリを削除"""
         try:
@@ -254,6 +422,7 @@ class DictionaryService:
             # 空になった場合は読みキーも削除
             if not self.entries[reading]:
                 del self.entries[reading]
+            self._invalidate_caches()
             
             self.logger.info(f"エントリを削除しました: {reading} -> {display}")
             return True
@@ -262,26 +431,169 @@ class DictionaryService:
             self.logger.error(f"エントリ削除中にエラーが発生しました: {str(e)}")
             return False
     
+    @staticmethod
+    def _insert_by_priority(bucket: List[DictionaryEntry], entry: DictionaryEntry):
+        """優先度の降順に並んだリストへ二分探索でエントリを挿入
+        
+        同じ優先度のエントリの後ろに入るため、追加後に安定ソートした場合と同じ順序になる
+        """
+        low, high = 0, len(bucket)
+        while low < high:
+            mid = (low + high) // 2
+            if bucket[mid].priority < entry.priority:
+                high = mid
+            else:
+                low = mid + 1
+        bucket.insert(low, entry)
+    
     def get_entries_for_reading(self, reading: str) -> List[DictionaryEntry]:
         """指定した読みのエントリ一覧を取得"""
         return self.entries.get(reading, [])
     
+    @_synchronized
+    def _get_search_columns(self) -> Dict:
+        """高度な検索用の列指向データを取得（必要な場合のみ再構築）"""
+        if self._search_columns is None:
+            entries = self._get_all_entries()
+            count = len(entries)
+            self._search_columns = {
+                "entries": entries,
+                "priority": np.fromiter((e.priority for e in entries), dtype=np.int64, count=count),
+                "usage_count": np.fromiter((e.usage_count for e in entries), dtype=np.int64, count=count),
+                "category": np.array([e.category for e in entries], dtype=object),
+                "created_at": np.array([e.created_at for e in entries], dtype=object),
+            }
+        return self._search_columns
+    
+    @_synchronized
+    def _get_category_index(self) -> Dict[str, Dict]:
+        """カテゴリ別の集計を取得（必要な場合のみ再構築）
+        
+        UIがエントリを直接書き換えてから更新メソッドを呼ぶため、
+        差分更新ではなく変更ごとに一括で再集計する
+        """
+        if self._category_index is None:
+            category_index = {}
+            for entry in self._get_all_entries():
+                stats = category_index.get(entry.category)
+                if stats is None:
+                    stats = category_index[entry.category] = {
+                        "count": 0,
+                        "usage": 0,
+                        "used": 0,
+                        "priority_sum": 0,
+                        "most_used": None
+                    }
+                stats["count"] += 1
+                stats["usage"] += entry.usage_count
+                stats["priority_sum"] += entry.priority
+                if entry.usage_count > 0:
+                    stats["used"] += 1
+                
+                # 最も使用されているエントリを更新
+                if stats["most_used"] is None or entry.usage_count > stats["most_used"].usage_count:
+                    stats["most_used"] = entry
+            self._category_index = category_index
+        return self._category_index
+    
+    @_synchronized
+    def _get_display_index(self) -> Dict[str, List[Tuple[int, DictionaryEntry]]]:
+        """表記の先頭文字をキーとした(全エントリ中の位置, エントリ)の索引を取得（必要な場合のみ再構築）"""
+        if self._display_index is None:
+            display_index = {}
+            for order, entry in enumerate(self._get_all_entries()):
+                display_index.setdefault(entry.display[:1], []).append((order, entry))
+            self._display_index = display_index
+        return self._display_index
+    
+    @_synchronized
+    def find_entries_in_text(self, text: str) -> List[DictionaryEntry]:
+        """表記がテキストに含まれるエントリ一覧を取得
+        
+        テキストに現れる文字で始まる表記だけを照合するため、辞書全体とは比較しない
+        
+        Returns:
+            List[DictionaryEntry]: 一致したエントリ（全エントリ一覧と同じ順序）
+        """
+        display_index = self._get_display_index()
+        # どの表記の先頭文字もテキストに現れなければ照合するまでもない
+        if "" not in display_index and display_index.keys().isdisjoint(text):
+            return []
+        
+        matches = []
+        # 空の表記は常に含まれるものとして扱う（従来の部分文字列判定と同じ）
+        for first_char in set(text) | {""}:
+            for order, entry in display_index.get(first_char, ()):
+                if entry.display in text:
+                    matches.append((order, entry))
+        matches.sort(key=itemgetter(0))
+        return [entry for _, entry in matches]
+    
+    def _now_iso_cached(self) -> str:
+        """現在時刻のISO形式文字列を取得（1秒以内の連続呼び出しでは使い回す）"""
+        now_ts = time.time()
+        if now_ts - self._now_ts > 1.0:
+            self._now_ts = now_ts
+            self._now_iso = datetime.fromtimestamp(now_ts).isoformat()
+        return self._now_iso
+    
+    def _invalidate_caches(self):
+        """エントリの変更に伴いキャッシュを破棄"""
+        self._all_entries = None
+        self._sorted_entries = None
+        self._search_columns = None
+        self._category_index = None
+        self._display_index = None
+        self._detailed_statistics = None
+        self._revision += 1
+    
     def get_all_entries(self) -> List[DictionaryEntry]:
-        """全エントリを取得"""
-        all_entries = []
-        for entries in self.entries.values():
-            all_entries.extend(entries)
-        return all_entries
+        """全エントリを取得（呼び出し側で変更できるようコピーを返す）"""
+        return list(self._get_all_entries())
+    
+    @staticmethod
+    def display_sort_key(entry: DictionaryEntry) -> Tuple[str, int, str]:
+        """一覧表示の並び順（カテゴリ、優先度の降順、読み）のキー"""
+        return (entry.category, -entry.priority, entry.reading)
     
+    @_synchronized
+    def get_sorted_entries(self) -> List[DictionaryEntry]:
+        """全エントリをカテゴリ、優先度の降順、読みの順に並べて取得
+        
+        並べ替えた結果は辞書が変更されるまで使い回す（呼び出し側で変更できるようコピーを返す）
+        """
+        if self._sorted_entries is None:
+            # display_sort_keyと同じ順序を、C実装のattrgetterを使った安定ソートの重ね掛けで求める
+            # （下位のキーから順に並べ替える。reverse=Trueでも同順位の並びは保たれる）
+            entries = sorted(self._get_all_entries(), key=_READING_KEY)
+            entries.sort(key=_PRIORITY_KEY, reverse=True)
+            entries.sort(key=_CATEGORY_KEY)
+            self._sorted_entries = entries
+        return list(self._sorted_entries)
+    
+    @_synchronized
+    def _get_all_entries(self) -> List[DictionaryEntry]:
+        """全エントリの一覧を取得（必要な場合のみ再構築、内部用のため変更しないこと）"""
+        if self._all_entries is None:
+            all_entries = []
+            for entries in self.entries.values():
+                all_entries.extend(entries)
+            self._all_entries = all_entries
+        return self._all_entries
+    
+    @_synchronized
     def search_entries(self, query: str, category: Optional[str] = None) -> List[DictionaryEntry]:
         """エントリを検索"""
+        query_lower = query.lower()
+        if category is not None:
+            category = sys.intern(category)
         results = []
         for entries in self.entries.values():
             for entry in entries:
-                # クエリマッチング
-                if (query.lower() in entry.reading.lower() or 
-                    query.lower() in entry.display.lower() or
-                    query.lower() in entry.notes.lower()):
+                # クエリマッチング（小文字化済みの文字列と比較）
+                if (query_lower in entry._reading_lc or 
+                    query_lower in entry._display_lc or
+                    query_lower in entry._notes_lc):
                     
                     # カテゴリフィルタ
                     if category is None or entry.category == category:
@@ -289,12 +601,13 @@ class DictionaryService:
         
         return results
     
+    @_synchronized
     def update_entry_usage(self, reading: str, display: str):
         """エントリの使用実績を更新"""
         if reading in self.entries:
             for entry in self.entries[reading]:
                 if entry.display == display:
-                    entry.update_usage()
+                    entry.update_usage(self._now_iso_cached())
                     # 使用実績に基づいて優先度を再計算
                     entry.priority = PriorityManager.calculate_auto_priority(
                         entry.reading, entry.display, entry.usage_count
@@ -302,15 +615,17 @@ class DictionaryService:
                     break
             
             # 優先度順に再ソート
-            self.entries[reading].sort(key=lambda x: x.priority, reverse=True)
+            self.entries[reading].sort(key=_PRIORITY_KEY, reverse=True)
+            self._invalidate_caches()
     
+    @_synchronized
     def load_dictionary(self, file_path: str) -> bool:
         """辞書ファイルを読み込み"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _read_json(file_path)
             
             self.entries.clear()
+            self._invalidate_caches()
             
             for entry_data in data.get("dictionary_entries", []):
                 entry = DictionaryEntry.from_dict(entry_data)
@@ -320,16 +635,17 @@ class DictionaryService:
             
             # 各読みのエントリを優先度順にソート
             for reading in self.entries:
-                self.entries[reading].sort(key=lambda x: x.priority, reverse=True)
+                self.entries[reading].sort(key=_PRIORITY_KEY, reverse=True)
             
             self.current_file = file_path
-            self.logger.info(f"辞書を読み込みました: {file_path} ({len(self.get_all_entries())}件)")
+            self.logger.info(f"辞書を読み込みました: {file_path} ({len(self._get_all_entries())}件)")
             return True
             
         except Exception as e:
             self.logger.error(f"辞書読み込み中にエラーが発生しました: {str(e)}")
             return False
     
+    @_synchronized
     def save_dictionary(self, file_path: Optional[str] = None) -> bool:
         """辞書ファイルを保存"""
         try:
@@ -340,15 +656,15 @@ class DictionaryService:
                 file_path = str(self.dictionary_dir / "custom.json")
             
             data = {
-                "dictionary_entries": [entry.to_dict() for entry in self.get_all_entries()],
+                "dictionary_entries": [entry.to_dict() for entry in self._get_all_entries()],
                 "created_at": datetime.now().isoformat(),
                 "version": "1.0"
             }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            _write_json(file_path, data)
             
             self.current_file = file_path
+            self._dirty = False
             self.logger.info(f"辞書を保存しました: {file_path}")
             return True
             
@@ -356,9 +672,17 @@ class DictionaryService:
             self.logger.error(f"辞書保存中にエラーが発生しました: {str(e)}")
             return False
     
-    def import_from_csv(self, csv_path: str) -> Tuple[int, int, int]:
+    @_synchronized
+    def import_from_csv(self, csv_path: str,
+                        progress_callback: Optional[Callable[[int, List[DictionaryEntry]], bool]] = None
+                        ) -> Tuple[int, int, int]:
         """CSVファイルから辞書をインポート
         
+        Args:
+            csv_path: CSVファイルのパス
+            progress_callback: 一定行数ごとに処理済みの行数と、前回の通知以降に追加したエントリを受け取る関数。
+                Falseを返すとそこでインポートを中断する（それまでに追加したエントリは残る）
+        
         Returns:
             Tuple[int, int, int]: (成功件数, 重複件数, エラー件数)
         """
@@ -366,82 +690,95 @@ class DictionaryService:
         duplicate_count = 0
         error_count = 0
         
+        # 一括作成するエントリの作成日時は1回だけ取得して共有
+        now = self._now_iso_cached()
+        
+        # 既存の(読み, 表記)を一度だけ集めて重複チェックに使う
+        seen = {(reading, entry.display) for reading, entries in self.entries.items() for entry in entries}
+        # 追加のあった読み（最後にまとめて優先度順にソート）
+        touched = set()
+        # 前回の進捗通知以降に追加したエントリ
+        added: List[DictionaryEntry] = []
+        
         try:
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+            with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                
+                # ヘッダー行から列位置を解決（存在しない列は-1）
+                header = next(reader, [])
+                columns = {name.strip(): index for index, name in enumerate(header)}
+                reading_col = columns.get('読み', -1)
+                display_col = columns.get('表記', -1)
+                category_col = columns.get('カテゴリ', -1)
+                priority_col = columns.get('優先度', -1)
+                notes_col = columns.get('備考', -1)
+                usage_count_col = columns.get('使用回数', -1)
+                
+                def field(row: List[str], index: int) -> str:
+                    """列位置から値を取得（列が無い場合は空文字）"""
+                    return row[index].strip() if 0 <= index < len(row) else ''
                 
+                interval = self.IMPORT_PROGRESS_INTERVAL
                 for row_num, row in enumerate(reader, start=2):  # ヘッダー行を考慮して2から開始
+                    # 進捗の通知と中断の確認
+                    processed_rows = row_num - 2
+                    if progress_callback is not None and processed_rows and processed_rows % interval == 0:
+                        batch, added = added, []
+                        if progress_callback(processed_rows, batch) is False:
+                            self.logger.info(f"CSV インポートを中断しました: {processed_rows}行を処理済み")
+                            break
+                    
                     try:
                         # 行が空の場合はスキップ
-                        if not row or all(not value for value in row.values()):
+                        if not any(row):
                             continue
                         
-                        # 安全な文字列取得（Noneチェック）
-                        reading_raw = row.get('読み')
-                        display_raw = row.get('表記')
-                        category_raw = row.get('カテゴリ')
-                        notes_raw = row.get('備考')
-                        
-                        # None チェックと文字列変換
-                        reading = str(reading_raw).strip() if reading_raw is not None else ''
-                        display = str(display_raw).strip() if display_raw is not None else ''
-                        category = str(category_raw).strip() if category_raw is not None else ''
-                        notes = str(notes_raw).strip() if notes_raw is not None else ''
+                        reading = field(row, reading_col)
+                        display = field(row, display_col)
+                        category = field(row, category_col)
+                        notes = field(row, notes_col)
                         
                         # 必須フィールドのチェック
-                        if not reading or not display or reading == 'None' or display == 'None':
+                        if not reading or not display:
                             self.logger.warning(f"行{row_num}: 読みまたは表記が空です (読み: '{reading}', 表記: '{display}')")
                             error_count += 1
                             continue
                         
                         # 優先度の処理（数値変換エラーを防ぐ）
-                        priority_raw = row.get('優先度')
+                        priority_raw = field(row, priority_col)
                         try:
-                            if priority_raw is not None and str(priority_raw).strip():
-                                priority = int(float(str(priority_raw).strip()))
-                            else:
-                                priority = 50
-                        except (ValueError, TypeError):
+                            priority = int(float(priority_raw)) if priority_raw else 50
+                        except ValueError:
                             priority = 50
                         
                         # 使用回数の処理（CSVエクスポート時に追加されるフィールド）
-                        usage_count_raw = row.get('使用回数')
+                        usage_count_raw = field(row, usage_count_col)
                         try:
-                            if usage_count_raw is not None and str(usage_count_raw).strip():
-                                usage_count = int(float(str(usage_count_raw).strip()))
-                            else:
-                                usage_count = 0
-                        except (ValueError, TypeError):
+                            usage_count = int(float(usage_count_raw)) if usage_count_raw else 0
+                        except ValueError:
                             usage_count = 0
                         
                         # カテゴリが空の場合は自動推定
-                        if not category or category == 'None':
+                        if not category:
                             category = CategoryManager.predict_category(reading, display)
                         
                         # 重複チェック
-                        is_duplicate = False
-                        if reading in self.entries:
-                            for existing in self.entries[reading]:
-                                if existing.display == display:
-                                    self.logger.info(f"行{row_num}: 重複エントリをスキップしました: {reading} -> {display}")
-                                    duplicate_count += 1
-                                    is_duplicate = True
-                                    break
-                        
-                        if is_duplicate:
+                        key = (reading, display)
+                        if key in seen:
+                            self.logger.info(f"行{row_num}: 重複エントリをスキップしました: {reading} -> {display}")
+                            duplicate_count += 1
                             continue
+                        seen.add(key)
                         
                         # エントリを作成して追加
-                        entry = DictionaryEntry(reading, display, category, priority, notes)
+                        entry = DictionaryEntry(reading, display, category, priority, notes, now=now)
                         entry.usage_count = usage_count  # 使用回数を設定
                         
-                        # 重複チェックを回避して直接追加
-                        if reading not in self.entries:
-                            self.entries[reading] = []
-                        
-                        self.entries[reading].append(entry)
-                        # 優先度順にソート
-                        self.entries[reading].sort(key=lambda x: x.priority, reverse=True)
+                        # 重複チェックを回避して直接追加（ソートは最後にまとめて行う）
+                        self.entries.setdefault(reading, []).append(entry)
+                        touched.add(reading)
+                        if progress_callback is not None:
+                            added.append(entry)
                         
                         self.logger.info(f"行{row_num}: エントリを追加しました: {reading} -> {display}")
                         success_count += 1
@@ -456,7 +793,14 @@ class DictionaryService:
         except Exception as e:
             self.logger.error(f"CSV インポート中にエラーが発生しました: {str(e)}")
             return 0, 0, 1
+        finally:
+            # 追加のあった読みだけを優先度順に並べ直し、キャッシュを一度だけ破棄
+            if touched:
+                for reading in touched:
+                    self.entries[reading].sort(key=_PRIORITY_KEY, reverse=True)
+                self._invalidate_caches()
     
+    @_synchronized
     def export_to_csv(self, csv_path: str) -> bool:
         """辞書をCSVファイルにエクスポート"""
         try:
@@ -466,7 +810,7 @@ class DictionaryService:
                 
                 writer.writeheader()
                 
-                for entry in self.get_all_entries():
+                for entry in self._get_all_entries():
                     writer.writerow({
                         '読み': entry.reading,
                         '表記': entry.display,
@@ -488,60 +832,79 @@ class DictionaryService:
         if not self.enabled or not self.entries:
             return ""
         
-        prompt_text = "以下の固有名詞辞書を参考にして、正確な表記で文字起こしを行ってください：\n\n"
+        parts = ["以下の固有名詞辞書を参考にして、正確な表記で文字起こしを行ってください：\n\n"]
         
         # カテゴリ別に整理
         categories = {}
-        all_entries = self.get_all_entries()
         
-        # 優先度と使用頻度でソート
-        all_entries.sort(key=lambda x: (x.priority, x.usage_count), reverse=True)
-        
-        # 最大エントリ数に制限
-        limited_entries = all_entries[:max_entries]
+        # 優先度と使用頻度の上位のみを取得（全件ソートは行わない）
+        limited_entries = heapq.nlargest(
+            max_entries, self._get_all_entries(), key=_PRIORITY_USAGE_KEY
+        )
         
         for entry in limited_entries:
             if entry.category not in categories:
                 categories[entry.category] = []
             categories[entry.category].append(entry)
         
-        # カテゴリ別に辞書情報を追加
+        # カテゴリ別に辞書情報を追加（文字列は最後に一度だけ連結）
         for category, entries in categories.items():
-            prompt_text += f"【{category}】\n"
+            parts.append(f"【{category}】\n")
             for entry in entries:
-                prompt_text += f"- {entry.reading} → {entry.display}"
                 if entry.notes:
-                    prompt_text += f" ({entry.notes})"
-                prompt_text += "\n"
-            prompt_text += "\n"
+                    parts.append(f"- {entry.reading} → {entry.display} ({entry.notes})\n")
+                else:
+                    parts.append(f"- {entry.reading} → {entry.display}\n")
+            parts.append("\n")
         
-        return prompt_text
+        return "".join(parts)
+    
+    @_synchronized
+    def mark_dirty(self):
+        """未保存の変更があることを記録し、一定時間後に保存する
+        
+        待ち時間の間に呼ばれた分は1回の保存にまとめられる
+        """
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    @_synchronized
+    def flush(self):
+        """未保存の変更があれば辞書ファイルに保存"""
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+            self._save_timer = None
+        if self._dirty:
+            self.save_dictionary()
     
     def set_enabled(self, enabled: bool):
         """辞書機能の有効/無効を設定"""
         self.enabled = enabled
+        self._revision += 1  # プロンプトの内容が変わるため版数を進める
         self.logger.info(f"辞書機能を{'有効' if enabled else '無効'}にしました")
     
     def is_enabled(self) -> bool:
         """辞書機能が有効かどうかを確認"""
         return self.enabled
     
+    def get_revision(self) -> int:
+        """辞書の版数を取得（エントリの変更や有効/無効の切り替えで増加する）"""
+        return self._revision
+    
+    @_synchronized
     def get_statistics(self) -> Dict:
         """辞書の統計情報を取得"""
-        all_entries = self.get_all_entries()
-        categories = {}
-        total_usage = 0
-        used_entries = 0
-        
-        for entry in all_entries:
-            if entry.category not in categories:
-                categories[entry.category] = {"count": 0, "usage": 0}
-            categories[entry.category]["count"] += 1
-            categories[entry.category]["usage"] += entry.usage_count
-            
-            total_usage += entry.usage_count
-            if entry.usage_count > 0:
-                used_entries += 1
+        all_entries = self._get_all_entries()
+        category_index = self._get_category_index()
+        categories = {
+            category: {"count": stats["count"], "usage": stats["usage"]}
+            for category, stats in category_index.items()
+        }
+        total_usage = sum(stats["usage"] for stats in category_index.values())
+        used_entries = sum(stats["used"] for stats in category_index.values())
         
         return {
             "total_entries": len(all_entries),
@@ -554,56 +917,59 @@ class DictionaryService:
             "current_file": self.current_file
         }
     
+    @_synchronized
     def get_detailed_statistics(self) -> Dict:
-        """詳細な統計情報を取得"""
-        all_entries = self.get_all_entries()
+        """詳細な統計情報を取得
+        
+        集計結果は辞書が変更されるまで使い回す（内部のキャッシュを返すため変更しないこと）
+        """
+        if self._detailed_statistics is None:
+            self._detailed_statistics = self._build_detailed_statistics()
+        return self._detailed_statistics
+    
+    def _build_detailed_statistics(self) -> Dict:
+        """詳細な統計情報を集計"""
+        limit = 10
+        
+        def push(heap: List[Tuple], key, order: int, entry: DictionaryEntry):
+            """上位limit件を保持する最小ヒープにエントリを追加"""
+            if len(heap) < limit:
+                heapq.heappush(heap, (key, order, entry))
+            elif key > heap[0][0]:
+                heapq.heapreplace(heap, (key, order, entry))
+        
+        # 使用頻度・作成日時・最終使用日時の上位10件を1回の走査でまとめて抽出
+        usage_heap, recent_heap, used_heap = [], [], []
+        for order, entry in enumerate(self._get_all_entries()):
+            order = -order  # 同じ値の場合は先に並んでいるエントリを優先
+            push(usage_heap, entry.usage_count, order, entry)
+            push(recent_heap, entry.created_at, order, entry)
+            if entry.last_used:
+                push(used_heap, entry.last_used, order, entry)
         
         # 使用頻度ランキング（上位10件）
-        usage_ranking = sorted(all_entries, key=lambda x: x.usage_count, reverse=True)[:10]
+        usage_ranking = [item[2] for item in sorted(usage_heap, reverse=True)]
         
         # 最近追加されたエントリ（上位10件）
-        recent_entries = sorted(all_entries, key=lambda x: x.created_at, reverse=True)[:10]
+        recent_entries = [item[2] for item in sorted(recent_heap, reverse=True)]
         
         # 最近使用されたエントリ（上位10件）
-        recently_used = [e for e in all_entries if e.last_used]
-        recently_used = sorted(recently_used, key=lambda x: x.last_used or "", reverse=True)[:10]
+        recently_used = [item[2] for item in sorted(used_heap, reverse=True)]
         
         # カテゴリ別詳細統計
         category_details = {}
-        for entry in all_entries:
-            if entry.category not in category_details:
-                category_details[entry.category] = {
-                    "count": 0,
-                    "total_usage": 0,
-                    "avg_priority": 0,
-                    "most_used": None,
-                    "entries": []
-                }
-            
-            cat_detail = category_details[entry.category]
-            cat_detail["count"] += 1
-            cat_detail["total_usage"] += entry.usage_count
-            cat_detail["entries"].append(entry)
-            
-            # 最も使用されているエントリを更新
-            if cat_detail["most_used"] is None or entry.usage_count > cat_detail["most_used"].usage_count:
-                cat_detail["most_used"] = entry
-        
-        # 平均優先度を計算とmost_usedの辞書化
-        for category, details in category_details.items():
-            if details["count"] > 0:
-                details["avg_priority"] = sum(e.priority for e in details["entries"]) / details["count"]
-            
-            # most_usedを辞書形式に変換
-            if details["most_used"]:
-                most_used_entry = details["most_used"]
-                details["most_used"] = {
+        for category, stats in self._get_category_index().items():
+            most_used_entry = stats["most_used"]
+            category_details[category] = {
+                "count": stats["count"],
+                "total_usage": stats["usage"],
+                "avg_priority": stats["priority_sum"] / stats["count"],
+                "most_used": {
                     "reading": most_used_entry.reading,
                     "display": most_used_entry.display,
                     "usage_count": most_used_entry.usage_count
                 }
-            
-            del details["entries"]  # メモリ節約のため削除
+            }
         
         return {
             "usage_ranking": [{"reading": e.reading, "display": e.display, "usage_count": e.usage_count, "category": e.category} for e in usage_ranking],
@@ -612,6 +978,7 @@ class DictionaryService:
             "category_details": category_details
         }
     
+    @_synchronized
     def search_entries_advanced(self, query: str = "", category: Optional[str] = None, 
                                min_usage: int = 0, max_usage: Optional[int] = None,
                                min_priority: int = 1, max_priority: int = 100,
@@ -634,51 +1001,49 @@ class DictionaryService:
         Returns:
             List[DictionaryEntry]: 検索結果
         """
-        results = []
+        columns = self._get_search_columns()
+        entries = columns["entries"]
+        priority = columns["priority"]
+        usage_count = columns["usage_count"]
         
-        for entries in self.entries.values():
-            for entry in entries:
-                # テキスト検索
-                if query:
-                    query_lower = query.lower()
-                    if not (query_lower in entry.reading.lower() or 
-                           query_lower in entry.display.lower() or
-                           query_lower in entry.notes.lower()):
-                        continue
-                
-                # カテゴリフィルタ
-                if category and entry.category != category:
-                    continue
-                
-                # 使用回数フィルタ
-                if entry.usage_count < min_usage:
-                    continue
-                if max_usage is not None and entry.usage_count > max_usage:
-                    continue
-                
-                # 優先度フィルタ
-                if entry.priority < min_priority or entry.priority > max_priority:
-                    continue
-                
-                # 日付フィルタ
-                if date_from and entry.created_at < date_from:
-                    continue
-                if date_to and entry.created_at > date_to:
-                    continue
-                
-                results.append(entry)
+        # 数値・カテゴリ・日付の条件は列ごとにまとめて評価
+        # （数値条件は作業用配列を使い回し、条件ごとに中間配列を確保しない）
+        mask = np.greater_equal(priority, min_priority)
+        scratch = np.empty_like(mask)
+        mask &= np.less_equal(priority, max_priority, out=scratch)
+        mask &= np.greater_equal(usage_count, min_usage, out=scratch)
+        if max_usage is not None:
+            mask &= np.less_equal(usage_count, max_usage, out=scratch)
+        if category:
+            # エントリ側のカテゴリは共有済みのため、同一オブジェクトとして即座に一致する
+            mask &= columns["category"] == sys.intern(category)
+        if date_from:
+            mask &= columns["created_at"] >= date_from
+        if date_to:
+            mask &= columns["created_at"] <= date_to
+        
+        indices = np.flatnonzero(mask)
+        
+        # テキスト検索（条件で絞り込んだ候補のみを対象とする）
+        if query:
+            query_lower = query.lower()
+            indices = np.array([
+                i for i in indices
+                if (query_lower in entries[i]._reading_lc or
+                    query_lower in entries[i]._display_lc or
+                    query_lower in entries[i]._notes_lc)
+            ], dtype=np.intp)
         
         # ソート
         reverse = sort_order == "desc"
-        if sort_by == "priority":
-            results.sort(key=lambda x: x.priority, reverse=reverse)
-        elif sort_by == "usage_count":
-            results.sort(key=lambda x: x.usage_count, reverse=reverse)
-        elif sort_by == "created_at":
-            results.sort(key=lambda x: x.created_at, reverse=reverse)
-        elif sort_by == "reading":
-            results.sort(key=lambda x: x.reading, reverse=reverse)
-        elif sort_by == "display":
-            results.sort(key=lambda x: x.display, reverse=reverse)
+        if sort_by in ("priority", "usage_count"):
+            keys = columns[sort_by][indices]
+            indices = indices[np.argsort(-keys if reverse else keys, kind="stable")]
+        
+        results = [entries[i] for i in indices]
+        
+        text_sort_key = _TEXT_SORT_KEYS.get(sort_by)
+        if text_sort_key is not None:
+            results.sort(key=text_sort_key, reverse=reverse)
         
         return results 
\ No newline at end of file
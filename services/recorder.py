@@ -4,11 +4,14 @@ import numpy as np
 import os
 import tempfile
 import time
-import glob
-from datetime import datetime, timedelta
+import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 class AudioRecorder:
+    # 無音検出で音の有無を判定する窓の長さ（フレーム数）
+    SILENCE_WINDOW_FRAMES = 256
+    
     def __init__(self, channels=1, rate=44100, chunk=1024, format_type=pyaudio.paInt16, 
                  silence_threshold=0.01, silence_duration=20):
         """音声録音クラスの初期化
@@ -27,43 +30,74 @@ class AudioRecorder:
         self.format = format_type
         self.audio = pyaudio.PyAudio()
         self.stream = None
-        self.frames = []
         self.is_recording = False
         self.temp_file = None
         
+        # WAVファイルの書き出し用（録音データはメモリに溜めず、チャンクごとに順次書き込む）
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._write_future = None
+        self._failed_write = None  # 録音中に最初に失敗したチャンクの書き込み
+        self._wav_writer = None
+        self._wav_lock = threading.Lock()  # 書き込みの投入と終了処理の投入が前後しないようにする
+        
         # 無音検出用の設定
         self.silence_threshold = silence_threshold
         self.silence_duration = silence_duration
         self.last_sound_time = 0
         self.silence_detected = False
+        # 無音を検出した時に一度だけ呼ばれる関数（PortAudioのスレッドから呼ばれる）
+        self.silence_callback = None
+        # 無音検出でチャンクをfloat32に変換する際の作業用バッファ
+        self._sample_buffer = np.empty(chunk * channels, dtype=np.float32)
+        # 無音検出の窓の配置（チャンクの長さごとにキャッシュ）
+        self._window_layout_size = None
+        self._window_layout = None
         
         # アプリケーション固有の一時ディレクトリの設定
         self.temp_dir = os.path.join(tempfile.gettempdir(), "speech_to_text_temp")
         if not os.path.exists(self.temp_dir):
             os.makedirs(self.temp_dir)
         
-        # 古い一時ファイルのクリーンアップ
-        self.cleanup_old_temp_files()
+        # 録音ごとに交互に使う一時ファイル
+        self._temp_file_pool = [
+            os.path.join(self.temp_dir, f"speech_to_text_pool_{i}.wav") for i in range(2)
+        ]
+        self._temp_file_index = 0
+        
+        # 古い一時ファイルのクリーンアップ（起動を待たせないようバックグラウンドで実行）
+        threading.Thread(target=self.cleanup_old_temp_files, daemon=True).start()
+    
+    @property
+    def silence_threshold(self):
+        """無音と判定する閾値（0.0-1.0）"""
+        return self._silence_threshold
+    
+    @silence_threshold.setter
+    def silence_threshold(self, value):
+        self._silence_threshold = value
+        # 16ビットオーディオのサンプル1つあたりの2乗値に換算した閾値
+        self._silence_sum_sq_per_sample = (value * 32768.0) ** 2
+    
+    def _iter_temp_wav_files(self):
+        """一時ディレクトリ内の録音ファイルを列挙する（DirEntryを返す）"""
+        with os.scandir(self.temp_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("speech_to_text_") and entry.name.endswith(".wav"):
+                    yield entry
     
     def cleanup_old_temp_files(self):
         """古い一時ファイルを削除する"""
         try:
             # 24時間以上前の一時ファイルを削除
-            cutoff_time = datetime.now() - timedelta(hours=24)
+            cutoff_time = time.time() - 24 * 60 * 60
             
-            # 一時ディレクトリ内の.wavファイルを検索
-            pattern = os.path.join(self.temp_dir, "speech_to_text_*.wav")
-            
-            for file_path in glob.glob(pattern):
+            # 一時ディレクトリ内の.wavファイルを検索（更新時刻は列挙時に取得した情報を使う）
+            for entry in self._iter_temp_wav_files():
                 try:
-                    # ファイルの最終更新時刻を取得
-                    file_time = datetime.fromtimestamp(os.path.getmtime(file_path))
-                    
-                    # 24時間以上前のファイルを削除
-                    if file_time < cutoff_time:
-                        os.remove(file_path)
+                    if entry.stat(follow_symlinks=False).st_mtime < cutoff_time:
+                        os.remove(entry.path)
                 except Exception as e:
-                    print(f"一時ファイルの削除に失敗しました: {file_path}, エラー: {str(e)}")
+                    print(f"一時ファイルの削除に失敗しました: {entry.path}, エラー: {str(e)}")
         except Exception as e:
             print(f"一時ファイルのクリーンアップに失敗しました: {str(e)}")
     
@@ -71,15 +105,13 @@ class AudioRecorder:
         """すべての一時ファイルを手動で削除する"""
         try:
             # 一時ディレクトリ内の.wavファイルを検索
-            pattern = os.path.join(self.temp_dir, "speech_to_text_*.wav")
-            
             deleted_count = 0
-            for file_path in glob.glob(pattern):
+            for entry in self._iter_temp_wav_files():
                 try:
-                    os.remove(file_path)
+                    os.remove(entry.path)
                     deleted_count += 1
                 except Exception as e:
-                    print(f"一時ファイルの削除に失敗しました: {file_path}, エラー: {str(e)}")
+                    print(f"一時ファイルの削除に失敗しました: {entry.path}, エラー: {str(e)}")
             
             return deleted_count
         except Exception as e:
@@ -91,25 +123,40 @@ class AudioRecorder:
         if self.is_recording:
             return False
         
-        # 前回の一時ファイルが残っている場合は削除
-        if self.temp_file and os.path.exists(self.temp_file):
-            try:
-                os.remove(self.temp_file)
-            except:
-                pass
-            self.temp_file = None
-        
-        self.frames = []
-        self.stream = self.audio.open(
-            format=self.format,
-            channels=self.channels,
-            rate=self.rate,
-            input=True,
-            frames_per_buffer=self.chunk
-        )
-        self.is_recording = True
-        self.last_sound_time = time.time()
+        # 前回の書き出しが終わってから一時ファイルを扱う
+        self.wait_ready()
+        
+        # 一時ファイルは2つのファイル名を交互に使い回す
+        # （直前の録音を残したまま、その前の録音のファイルを上書きする）
+        self.temp_file = self._temp_file_pool[self._temp_file_index]
+        self._temp_file_index ^= 1
+        
+        wav_writer = wave.open(self.temp_file, 'wb')
+        wav_writer.setnchannels(self.channels)
+        wav_writer.setsampwidth(self.audio.get_sample_size(self.format))
+        wav_writer.setframerate(self.rate)
+        self._wav_writer = wav_writer
+        
+        self.last_sound_time = time.monotonic()
         self.silence_detected = False
+        
+        # コールバックモードで開き、PortAudioのスレッドから届いたチャンクを直接処理する
+        try:
+            self.stream = self.audio.open(
+                format=self.format,
+                channels=self.channels,
+                rate=self.rate,
+                input=True,
+                frames_per_buffer=self.chunk,
+                stream_callback=self._stream_callback
+            )
+        except Exception:
+            with self._wav_lock:
+                self._wav_writer = None
+            wav_writer.close()
+            raise
+        
+        self.is_recording = True
         return True
 
     def stop_recording(self):
@@ -123,42 +170,90 @@ class AudioRecorder:
             self.stream.close()
             self.stream = None
         
-        # 前回の一時ファイルが残っている場合は削除
-        if self.temp_file and os.path.exists(self.temp_file):
-            try:
-                os.remove(self.temp_file)
-            except:
-                pass
+        # WAVファイルの終了処理（ヘッダーの確定）はワーカースレッドで行い、パスはすぐに返す
+        # （読み込む側はwait_ready()で書き込み完了を待つ）
+        with self._wav_lock:
+            wav_writer, self._wav_writer = self._wav_writer, None
+            if wav_writer is not None:
+                self._write_future = self._io_executor.submit(wav_writer.close)
+        
+        return self.temp_file
+    
+    def wait_ready(self):
+        """直前の録音のWAVファイル書き出しが完了するまで待つ
+        
+        Raises:
+            Exception: 書き出し中に発生した例外
+        """
+        future = self._write_future
+        if future is None:
+            return
+        try:
+            future.result()
+            # チャンクの書き込みに失敗していた場合は、途中で欠けたファイルとして扱う
+            failed_write = self._failed_write
+            if failed_write is not None:
+                failed_write.result()
+        finally:
+            # 失敗は一度だけ報告し、以降の録音には持ち越さない
+            self._write_future = None
+            self._failed_write = None
+    
+    def _stream_callback(self, in_data, frame_count, time_info, status):
+        """PyAudioのストリームコールバック（PortAudioのスレッドで呼ばれる）"""
+        self._process_chunk(in_data)
+        return (None, pyaudio.paContinue)
+    
+    def _process_chunk(self, data):
+        """録音したチャンクを書き込み、無音検出を行う"""
+        # ヘッダーの更新は終了時にまとめて行うため、生データのまま書き込む
+        with self._wav_lock:
+            if self._wav_writer is None:
+                return
+            future = self._io_executor.submit(self._wav_writer.writeframesraw, data)
+        future.add_done_callback(self._check_write)
         
-        # 一時ファイルの作成（タイムスタンプ付き）
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.temp_file = os.path.join(self.temp_dir, f"speech_to_text_{timestamp}.wav")
+        # 無音検出（バッファをコピーせずにint16として参照）
+        audio_data = np.frombuffer(data, dtype=np.int16)
+        # int16のまま2乗するとオーバーフローするため、float32の内積で2乗和を求める
+        # （変換先は使い回しのバッファとし、チャンクごとに配列を確保しない）
+        if audio_data.size > self._sample_buffer.size:
+            self._sample_buffer = np.empty(audio_data.size, dtype=np.float32)
+        samples = self._sample_buffer[:audio_data.size]
+        samples[...] = audio_data
+        np.multiply(samples, samples, out=samples)
         
-        # WAVファイルに保存
-        with wave.open(self.temp_file, 'wb') as wf:
-            wf.setnchannels(self.channels)
-            wf.setsampwidth(self.audio.get_sample_size(self.format))
-            wf.setframerate(self.rate)
-            wf.writeframes(b''.join(self.frames))
+        # チャンクを短い窓に分けて窓ごとの2乗和を求め、いずれかの窓が閾値を超えれば音ありとする
+        # （チャンク全体の平均では埋もれる短い発話の立ち上がりも検出できる）
+        window_starts, window_lengths = self._get_window_layout(samples.size)
+        window_sum_sq = np.add.reduceat(samples, window_starts) if samples.size else samples
         
-        return self.temp_file
+        # 無音の継続時間は時刻のずれの影響を受けない単調時計で計測（1チャンク1回だけ取得）
+        now = time.monotonic()
+        # 正規化RMSと閾値の比較を2乗和どうしの比較に変換（平方根と除算を省く）
+        if np.any(window_sum_sq > self._silence_sum_sq_per_sample * window_lengths):
+            self.last_sound_time = now
+            self.silence_detected = False
+        elif not self.silence_detected and now - self.last_sound_time > self.silence_duration:
+            self.silence_detected = True
+            callback = self.silence_callback
+            if callback is not None:
+                callback()
     
-    def record_frame(self):
-        """録音中のフレームを記録し、無音検出を行う"""
-        if self.is_recording and self.stream:
-            data = self.stream.read(self.chunk)
-            self.frames.append(data)
-            
-            # 無音検出
-            audio_data = np.frombuffer(data, dtype=np.int16)
-            rms = np.sqrt(np.mean(audio_data**2))
-            normalized_rms = rms / 32768.0  # 16ビットオーディオの正規化
-            
-            if normalized_rms > self.silence_threshold:
-                self.last_sound_time = time.time()
-                self.silence_detected = False
-            elif time.time() - self.last_sound_time > self.silence_duration:
-                self.silence_detected = True
+    def _check_write(self, future):
+        """チャンクの書き込み結果を確認し、最初の失敗を記録する（書き込みスレッドで呼ばれる）"""
+        if self._failed_write is None and future.exception() is not None:
+            self._failed_write = future
+    
+    def _get_window_layout(self, size):
+        """無音検出の窓の開始位置と長さを取得する（チャンクの長さが変わった場合のみ再計算）"""
+        if self._window_layout_size != size:
+            window = self.SILENCE_WINDOW_FRAMES * self.channels
+            starts = np.arange(0, size, window)
+            lengths = np.diff(np.append(starts, size)).astype(np.float32)
+            self._window_layout = (starts, lengths)
+            self._window_layout_size = size
+        return self._window_layout
     
     def is_silence_detected(self):
         """無音が検出されたかどうかを返す"""
@@ -170,12 +265,20 @@ class AudioRecorder:
             self.stream.close()
         self.audio.terminate()
         
+        # 書き出し中のWAVファイルがあれば完了を待ってから後始末する
+        with self._wav_lock:
+            wav_writer, self._wav_writer = self._wav_writer, None
+            if wav_writer is not None:
+                self._io_executor.submit(wav_writer.close)
+        self._io_executor.shutdown(wait=True)
+        
         # 一時ファイルの削除
-        if self.temp_file and os.path.exists(self.temp_file):
-            try:
-                os.remove(self.temp_file)
-            except:
-                pass
+        for temp_file in self._temp_file_pool:
+            if os.path.exists(temp_file):
+                try:
+                    os.remove(temp_file)
+                except:
+                    pass
         
         # 古い一時ファイルのクリーンアップ
         self.cleanup_old_temp_files()
@@ -1,11 +1,16 @@
 import os
+import re
 import google.genai as genai
 from google.genai import types
-import base64
 import logging
 from utils.logger import Logger
 from services.dictionary import DictionaryService
 
+# 文字起こし結果から削除するフィラーワード
+_FILLERS = ("えーと", "あー", "んー", "えっと", "まぁ", "あのー", "その", "なんか")
+# フィラーワードを1回の走査で削除するための正規表現（長い語を優先して照合）
+_FILLER_RE = re.compile("|".join(map(re.escape, sorted(_FILLERS, key=len, reverse=True))))
+
 class TranscriptionService:
     # 利用可能なモデルのリスト（無料枠対応）
     AVAILABLE_MODELS = {
@@ -16,6 +21,9 @@ class TranscriptionService:
         'gemini-1.5-flash-8b': '軽量で高速な文字起こしに適した従来モデル'
     }
 
+    # これを超える音声ファイルはリクエストに埋め込まず、Files APIでアップロードする
+    INLINE_AUDIO_MAX_BYTES = 4 * 1024 * 1024
+
     # 文字起こしモードの定義
     TRANSCRIPTION_MODES = {
         'clean': {
@@ -87,6 +95,10 @@ class TranscriptionService:
         # 辞書サービスの初期化
         self.dictionary_service = DictionaryService()
         
+        # 組み立て済みプロンプトのキャッシュ（モードと辞書の版数が同じ間は使い回す）
+        self._prompt_cache_key = None
+        self._prompt_cache = ""
+        
         self.logger.info("Gemini APIの初期化が完了しました")
     
     def set_model(self, model_name):
@@ -171,43 +183,44 @@ class TranscriptionService:
             self.logger.error(error_msg)
             raise FileNotFoundError(error_msg)
         
-        # 音声ファイルをbase64エンコードする
-        self.logger.info("音声ファイルをbase64エンコードしています...")
-        with open(audio_file_path, "rb") as audio_file:
-            audio_data = audio_file.read()
-            audio_base64 = base64.b64encode(audio_data).decode("utf-8")
-            self.logger.debug(f"音声ファイルのサイズ: {len(audio_data)} bytes")
-        
         # 音声データのMIMEタイプを設定
         mime_type = "audio/wav"
         
-        # 現在のモードに対応するプロンプトを取得
-        base_prompt = self.TRANSCRIPTION_MODES[self.mode]['prompt']
+        file_size = os.path.getsize(audio_file_path)
+        self.logger.debug(f"音声ファイルのサイズ: {file_size} bytes")
+        use_upload = file_size > self.INLINE_AUDIO_MAX_BYTES
         
-        # 辞書情報を含む拡張プロンプトを生成
-        dictionary_prompt = self.dictionary_service.generate_prompt_dictionary()
-        if dictionary_prompt:
-            prompt = dictionary_prompt + "\n" + base_prompt
-            self.logger.debug("辞書情報を含むプロンプトを使用します")
-        else:
-            prompt = base_prompt
-            
+        if not use_upload:
+            # 音声ファイルを読み込む（エンコードはSDKが送信時に行うため生のバイト列のまま渡す）
+            self.logger.info("音声ファイルを読み込んでいます...")
+            with open(audio_file_path, "rb") as audio_file:
+                audio_data = audio_file.read()
+            audio_part = types.Part(
+                inline_data=types.Blob(
+                    mime_type=mime_type,
+                    data=audio_data
+                )
+            )
+        
+        prompt = self._get_prompt()
         self.logger.debug(f"プロンプト: {prompt}")
         
         # 音声データとプロンプトを送信
-        self.logger.info("Gemini APIにリクエストを送信しています...")
+        uploaded_file = None
         try:
+            if use_upload:
+                # 大きな音声ファイルはアップロードし、リクエストにはファイルの参照だけを含める
+                self.logger.info("音声ファイルをGemini APIにアップロードしています...")
+                uploaded_file = self.client.files.upload(
+                    file=audio_file_path,
+                    config=types.UploadFileConfig(mime_type=mime_type)
+                )
+                audio_part = uploaded_file
+            
+            self.logger.info("Gemini APIにリクエストを送信しています...")
             model = self.client.models.generate_content(
                 model=self.model_name,
-                contents=[
-                    prompt,
-                    types.Part(
-                        inline_data=types.Blob(
-                            mime_type=mime_type,
-                            data=audio_data
-                        )
-                    )
-                ]
+                contents=[prompt, audio_part]
             )
             self.logger.debug(f"APIレスポンス: {model.text}")
         except Exception as e:
@@ -223,6 +236,9 @@ class TranscriptionService:
             
             self.logger.error(error_msg, exc_info=True)
             return error_msg
+        finally:
+            if uploaded_file is not None:
+                self._delete_uploaded_file(uploaded_file)
         
         # レスポンスからテキストを抽出
         if model.text:
@@ -239,6 +255,45 @@ class TranscriptionService:
             self.logger.error(error_msg)
             return error_msg
     
+    def _get_prompt(self):
+        """現在のモードと辞書に対応するプロンプトを取得する
+        
+        辞書の版数が変わらない間は、前回組み立てたプロンプトを返す
+        
+        Returns:
+            str: Gemini APIに送信するプロンプト
+        """
+        cache_key = (self.mode, self.dictionary_service.get_revision())
+        if cache_key == self._prompt_cache_key:
+            return self._prompt_cache
+        
+        # 現在のモードに対応するプロンプトを取得
+        base_prompt = self.TRANSCRIPTION_MODES[self.mode]['prompt']
+        
+        # 辞書情報を含む拡張プロンプトを生成
+        dictionary_prompt = self.dictionary_service.generate_prompt_dictionary()
+        if dictionary_prompt:
+            prompt = dictionary_prompt + "\n" + base_prompt
+            self.logger.debug("辞書情報を含むプロンプトを使用します")
+        else:
+            prompt = base_prompt
+        
+        self._prompt_cache_key = cache_key
+        self._prompt_cache = prompt
+        return prompt
+    
+    def _delete_uploaded_file(self, uploaded_file):
+        """文字起こしに使用したアップロード済みファイルを削除する
+        
+        Args:
+            uploaded_file: Files APIでアップロードしたファイル
+        """
+        try:
+            self.client.files.delete(name=uploaded_file.name)
+            self.logger.debug(f"アップロードしたファイルを削除しました: {uploaded_file.name}")
+        except Exception as e:
+            self.logger.warning(f"アップロードしたファイルの削除に失敗しました: {str(e)}")
+    
     def cleanup_text(self, text):
         """文字起こしテキストからフィラーワードを削除する
         
@@ -252,13 +307,8 @@ class TranscriptionService:
         self.logger.debug(f"クリーンアップ前のテキスト: {text}")
         
         # すでにGemini APIがクリーンアップしているが、念のため追加処理を実施
-        fillers = ["えーと", "あー", "んー", "えっと", "まぁ", "あのー", "その", "なんか"]
-        cleaned_text = text
-        
-        # フィラーワードの削除
-        for filler in fillers:
-            cleaned_text = cleaned_text.replace(filler + " ", "")
-            cleaned_text = cleaned_text.replace(filler, "")
+        # フィラーワードの削除（直後の半角スペースは次の処理でまとめて削除される）
+        cleaned_text = _FILLER_RE.sub("", text)
         
         # 半角スペースの削除
         cleaned_text = cleaned_text.replace(" ", "")
@@ -303,18 +353,19 @@ class TranscriptionService:
             return
         
         try:
-            # 全ての辞書エントリを取得
-            all_entries = self.dictionary_service.get_all_entries()
+            # 文字起こし結果に表記が含まれる辞書エントリを取得
+            matched_entries = self.dictionary_service.find_entries_in_text(transcribed_text)
+            if not matched_entries:
+                # 一致するエントリが無ければ使用実績は変わらないため保存も不要
+                return
             
-            # 文字起こし結果に含まれる表記をチェック
-            for entry in all_entries:
-                if entry.display in transcribed_text:
-                    # 使用回数を更新
-                    self.dictionary_service.update_entry_usage(entry.reading, entry.display)
-                    self.logger.debug(f"辞書エントリの使用回数を更新: {entry.reading} -> {entry.display}")
+            for entry in matched_entries:
+                # 使用回数を更新
+                self.dictionary_service.update_entry_usage(entry.reading, entry.display)
+                self.logger.debug(f"辞書エントリの使用回数を更新: {entry.reading} -> {entry.display}")
             
-            # 使用実績が更新された場合は辞書を保存
-            self.dictionary_service.save_dictionary()
+            # 使用実績の保存は遅延させ、連続した文字起こしの分をまとめて書き出す
+            self.dictionary_service.mark_dirty()
             
         except Exception as e:
             self.logger.warning(f"辞書使用回数の更新中にエラーが発生しました: {str(e)}") 
\ No newline at end of file
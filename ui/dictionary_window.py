@@ -1,20 +1,22 @@
-import sys
+import functools
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
     QPushButton, QLineEdit, QComboBox, QSpinBox, QTextEdit, QLabel,
     QGroupBox, QFileDialog, QMessageBox, QHeaderView, QCheckBox,
-    QSplitter, QWidget, QFormLayout, QProgressBar, QApplication
+    QSplitter, QWidget, QFormLayout, QProgressDialog
+)
+from PySide6.QtCore import (
+    Qt, QThread, QTimer, Signal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 )
-from PySide6.QtCore import Qt, QThread, Signal
-from PySide6.QtGui import QFont, QIcon
 from pathlib import Path
-from typing import List, Optional
-from services.dictionary import DictionaryService, DictionaryEntry, CategoryManager
+from typing import List, Dict, Optional, Tuple
+from services.dictionary import DictionaryService, DictionaryEntry, CategoryManager, PriorityManager
 from utils.logger import Logger
 
 class DictionaryImportThread(QThread):
     """CSV インポート用のワーカースレッド"""
-    progress = Signal(int, int)  # success_count, total_count
+    progress = Signal(int)  # processed_rows
+    entries_added = Signal(list)  # 前回の通知以降に追加したエントリ
     finished = Signal(int, int, int)  # success_count, duplicate_count, error_count
     error = Signal(str)
     
@@ -25,10 +27,230 @@ class DictionaryImportThread(QThread):
     
     def run(self):
         try:
-            success_count, duplicate_count, error_count = self.dictionary_service.import_from_csv(self.csv_path)
+            success_count, duplicate_count, error_count = self.dictionary_service.import_from_csv(
+                self.csv_path, self._report_progress
+            )
+            # 辞書を保存（成功した項目がある場合）
+            if success_count > 0:
+                self.dictionary_service.save_dictionary()
             self.finished.emit(success_count, duplicate_count, error_count)
         except Exception as e:
             self.error.emit(str(e))
+    
+    def _report_progress(self, processed_rows: int, added_entries: List[DictionaryEntry]) -> bool:
+        """進捗と追加したエントリを通知し、中断が要求されていなければTrueを返す"""
+        if added_entries:
+            self.entries_added.emit(added_entries)
+        self.progress.emit(processed_rows)
+        return not self.isInterruptionRequested()
+
+class DictionaryFileThread(QThread):
+    """辞書ファイルの読み込み・保存・エクスポート用のワーカースレッド"""
+    finished = Signal(bool)  # 処理結果
+    error = Signal(str)
+    
+    def __init__(self, task, *args):
+        super().__init__()
+        self.task = task
+        self.args = args
+    
+    def run(self):
+        try:
+            self.finished.emit(bool(self.task(*self.args)))
+        except Exception as e:
+            self.error.emit(str(e))
+
+@functools.lru_cache(maxsize=1024)
+def _predict_category_cached(reading: str, display: str) -> str:
+    """カテゴリの推定結果をキャッシュ（入力の打ち直しで同じ組み合わせが繰り返されるため）"""
+    return CategoryManager.predict_category(reading, display)
+
+
+# 一覧の並び順のキー（辞書サービスが返す並べ替え済みの一覧と同じ順序）
+_row_sort_key = DictionaryService.display_sort_key
+
+
+class DictionaryTableModel(QAbstractTableModel):
+    """辞書エントリ一覧のテーブルモデル
+    
+    セルごとのアイテムを作らず、表示する行の値だけを返す
+    （表示用の文字列は列ごとのリストに整形済みで持ち、描画のたびに属性参照や文字列変換をしない）
+    """
+    HEADERS = ["読み", "表記", "カテゴリ", "優先度", "使用回数", "備考"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries: List[DictionaryEntry] = []
+        self._columns: List[List[str]] = [[] for _ in self.HEADERS]
+        # (読み, 表記) -> 行 の索引（行の位置がずれる変更で破棄して遅延再構築）
+        self._row_index: Optional[Dict[Tuple[str, str], int]] = None
+    
+    @staticmethod
+    def _format_row(entry: DictionaryEntry) -> Tuple[str, str, str, str, str, str]:
+        """エントリの表示用の文字列を列の順に取得"""
+        return (entry.reading, entry.display, entry.category,
+                str(entry.priority), str(entry.usage_count), entry.notes)
+    
+    def set_entries(self, entries: List[DictionaryEntry]):
+        """表示するエントリ一覧を差し替え"""
+        self.beginResetModel()
+        self._entries = entries
+        self._columns = [
+            [entry.reading for entry in entries],
+            [entry.display for entry in entries],
+            [entry.category for entry in entries],
+            [str(entry.priority) for entry in entries],
+            [str(entry.usage_count) for entry in entries],
+            [entry.notes for entry in entries],
+        ]
+        self._row_index = None
+        self.endResetModel()
+    
+    def entries(self) -> List[DictionaryEntry]:
+        """表示中のエントリ一覧を取得"""
+        return self._entries
+    
+    def _sorted_row(self, entry: DictionaryEntry) -> int:
+        """並び順を保ったまま挿入できる行を二分探索で求める（同じキーの末尾）"""
+        key = _row_sort_key(entry)
+        low, high = 0, len(self._entries)
+        while low < high:
+            mid = (low + high) // 2
+            if key < _row_sort_key(self._entries[mid]):
+                high = mid
+            else:
+                low = mid + 1
+        return low
+    
+    def insert_entry(self, entry: DictionaryEntry) -> int:
+        """エントリを並び順の位置に1行だけ挿入し、挿入した行を返す"""
+        row = self._sorted_row(entry)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._row_index = None
+        self._entries.insert(row, entry)
+        for column, value in zip(self._columns, self._format_row(entry)):
+            column.insert(row, value)
+        self.endInsertRows()
+        return row
+    
+    def append_entries(self, entries: List[DictionaryEntry]):
+        """エントリをまとめて末尾に追加（並び順は呼び出し側でset_entriesにより整える）"""
+        if not entries:
+            return
+        first = len(self._entries)
+        self.beginInsertRows(QModelIndex(), first, first + len(entries) - 1)
+        # 末尾への追加では既存の行の位置は変わらないため、索引は追加分だけ更新する
+        if self._row_index is not None:
+            for row, entry in enumerate(entries, first):
+                self._row_index.setdefault((entry.reading, entry.display), row)
+        self._entries.extend(entries)
+        for column, values in zip(self._columns, zip(*map(self._format_row, entries))):
+            column.extend(values)
+        self.endInsertRows()
+    
+    def remove_row(self, row: int):
+        """指定行を1行だけ削除"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._row_index = None
+        del self._entries[row]
+        for column in self._columns:
+            del column[row]
+        self.endRemoveRows()
+    
+    def replace_entry(self, row: int, entry: DictionaryEntry) -> int:
+        """指定行のエントリを差し替え、差し替え後の行を返す
+        
+        並び順の位置が変わらない場合は行の再描画だけで済ませる
+        （編集ダイアログはエントリをその場で書き換えるため、変更前のキーではなく前後の行と比較する）
+        """
+        self._entries[row] = entry
+        key = _row_sort_key(entry)
+        in_order = (
+            (row == 0 or _row_sort_key(self._entries[row - 1]) <= key) and
+            (row == len(self._entries) - 1 or key <= _row_sort_key(self._entries[row + 1]))
+        )
+        if in_order:
+            for column, value in zip(self._columns, self._format_row(entry)):
+                column[row] = value
+            self._row_index = None  # 読みや表記が変わっている場合がある
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+            return row
+        
+        self.remove_row(row)
+        return self.insert_entry(entry)
+    
+    def row_of(self, reading: str, display: str) -> int:
+        """読みと表記からエントリの行を取得（見つからない場合は-1）"""
+        if self._row_index is None:
+            row_index = {}
+            for row, entry in enumerate(self._entries):
+                row_index.setdefault((entry.reading, entry.display), row)
+            self._row_index = row_index
+        return self._row_index.get((reading, display), -1)
+    
+    def entry(self, row: int) -> Optional[DictionaryEntry]:
+        """指定行のエントリを取得"""
+        if 0 <= row < len(self._entries):
+            return self._entries[row]
+        return None
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._entries)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._columns[index.column()][index.row()]
+        elif role == Qt.ItemDataRole.UserRole:
+            return self._entries[index.row()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+class DictionaryFilterProxyModel(QSortFilterProxyModel):
+    """検索文字列とカテゴリでエントリ一覧を絞り込むプロキシモデル"""
+    
+    ALL_CATEGORIES = "全カテゴリ"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._search_text = ""
+        self._category = self.ALL_CATEGORIES
+        self._active = False  # いずれかの条件で絞り込んでいるか
+    
+    def set_filter(self, search_text: str, category: str):
+        """絞り込み条件を設定（条件が変わった場合のみ再評価する）"""
+        search_text = search_text.lower()
+        if search_text == self._search_text and category == self._category:
+            return
+        self._search_text = search_text
+        self._category = category
+        self._active = bool(search_text) or category != self.ALL_CATEGORIES
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        # 絞り込み条件が無い場合はエントリを参照せずにすべての行を表示
+        if not self._active:
+            return True
+        
+        entry = self.sourceModel().entry(source_row)
+        if entry is None:
+            return False
+        
+        # カテゴリフィルタ
+        if self._category != self.ALL_CATEGORIES and entry.category != self._category:
+            return False
+        
+        # テキスト検索（エントリが保持する小文字化済みの文字列と比較）
+        return not self._search_text or entry.matches_text(self._search_text)
 
 class DictionaryEntryDialog(QDialog):
     """辞書エントリの追加・編集ダイアログ"""
@@ -107,8 +329,13 @@ class DictionaryEntryDialog(QDialog):
         layout.addLayout(button_layout)
         
         # 読みと表記の変更時にカテゴリと優先度を自動設定
-        self.reading_edit.textChanged.connect(self.on_text_changed)
-        self.display_edit.textChanged.connect(self.on_text_changed)
+        # （入力のたびに推定せず、入力が止まってから1回だけ推定する）
+        self._predict_timer = QTimer(self)
+        self._predict_timer.setSingleShot(True)
+        self._predict_timer.setInterval(120)
+        self._predict_timer.timeout.connect(self.on_text_changed)
+        self.reading_edit.textChanged.connect(self._predict_timer.start)
+        self.display_edit.textChanged.connect(self._predict_timer.start)
     
     def on_text_changed(self):
         """テキスト変更時の処理"""
@@ -118,15 +345,13 @@ class DictionaryEntryDialog(QDialog):
             
             if reading and display:
                 # カテゴリの自動推定
-                predicted_category = CategoryManager.predict_category(reading, display)
+                predicted_category = _predict_category_cached(reading, display)
                 index = self.category_combo.findText(predicted_category)
                 if index >= 0:
                     self.category_combo.setCurrentIndex(index)
     
     def auto_set_priority(self):
         """優先度の自動設定"""
-        from services.dictionary import PriorityManager
-        
         reading = self.reading_edit.text().strip()
         display = self.display_edit.text().strip()
         
@@ -151,8 +376,20 @@ class DictionaryEntryDialog(QDialog):
             self.priority_spin.setValue(self.entry.priority)
             self.notes_edit.setPlainText(self.entry.notes)
     
+    def _flush_prediction(self):
+        """保留中のカテゴリ予測があれば、すぐに実行する"""
+        if self._predict_timer.isActive():
+            self._predict_timer.stop()
+            self.on_text_changed()
+    
+    def accept(self):
+        """OK時の処理（入力直後に確定された場合も予測したカテゴリを反映する）"""
+        self._flush_prediction()
+        super().accept()
+    
     def get_entry_data(self) -> Optional[DictionaryEntry]:
         """入力されたデータからエントリを作成"""
+        self._flush_prediction()
         reading = self.reading_edit.text().strip()
         display = self.display_edit.text().strip()
         
@@ -166,11 +403,7 @@ class DictionaryEntryDialog(QDialog):
         
         if self.is_edit_mode and self.entry:
             # 既存エントリの更新
-            self.entry.reading = reading
-            self.entry.display = display
-            self.entry.category = category
-            self.entry.priority = priority
-            self.entry.notes = notes
+            self.entry.update_fields(reading, display, category, priority, notes)
             return self.entry
         else:
             # 新規エントリの作成
@@ -183,6 +416,11 @@ class DictionaryWindow(QDialog):
         super().__init__(parent)
         self.dictionary_service = dictionary_service
         self.logger = Logger.get_logger(__name__)
+        # 実行中のファイル処理スレッドと待機メッセージ
+        self._file_thread: Optional[QThread] = None
+        self._progress_dialog: Optional[QMessageBox] = None
+        # 一覧に検索結果を表示中かどうか（検索結果は表示順に並んでいないため差分更新できない）
+        self._showing_search_results = False
         self.setup_ui()
         self.load_dictionary_data()
     
@@ -196,6 +434,7 @@ class DictionaryWindow(QDialog):
         
         # ツールバー
         toolbar_layout = QHBoxLayout()
+        self.toolbar_layout = toolbar_layout  # 拡張機能のボタンの追加先
         
         # 検索
         search_layout = QHBoxLayout()
@@ -203,7 +442,12 @@ class DictionaryWindow(QDialog):
         
         self.search_edit = QLineEdit()
         self.search_edit.setPlaceholderText("読み、表記、備考で検索...")
-        self.search_edit.textChanged.connect(self.filter_entries)
+        # 入力のたびに絞り込まず、入力が止まってからまとめて絞り込む
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self.filter_entries)
+        self.search_edit.textChanged.connect(self._filter_timer.start)
         search_layout.addWidget(self.search_edit)
         
         self.category_filter = QComboBox()
@@ -249,22 +493,26 @@ class DictionaryWindow(QDialog):
         left_layout.addLayout(entry_buttons_layout)
         
         # エントリテーブル
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels(["読み", "表記", "カテゴリ", "優先度", "使用回数", "備考"])
+        self.table_model = DictionaryTableModel(self)
+        self.proxy_model = DictionaryFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.table_model)
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
         
         # テーブルの設定
+        # （内容に合わせた列幅の自動調整は行の変更のたびに全行を測り直すため、固定の初期幅にする）
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)  # 読み
-        header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)  # 表記
-        header.setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)  # カテゴリ
-        header.setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)  # 優先度
-        header.setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)  # 使用回数
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.resizeSection(0, 120)  # 読み
+        header.resizeSection(1, 120)  # 表記
+        header.resizeSection(2, 100)  # カテゴリ
+        header.resizeSection(3, 70)  # 優先度
+        header.resizeSection(4, 80)  # 使用回数
         header.setSectionResizeMode(5, QHeaderView.ResizeMode.Stretch)  # 備考
         
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
-        self.table.itemDoubleClicked.connect(self.edit_entry)
+        self.table.doubleClicked.connect(self.edit_entry)
         
         left_layout.addWidget(self.table)
         
@@ -336,6 +584,14 @@ class DictionaryWindow(QDialog):
         
         # 閉じるボタン
         close_layout = QHBoxLayout()
+        
+        # 操作結果の表示（成功時の通知はダイアログを出さずにここへ一時的に表示）
+        self.status_label = QLabel("")
+        close_layout.addWidget(self.status_label)
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(2000)
+        self._status_timer.timeout.connect(self.status_label.clear)
         close_layout.addStretch()
         
         self.close_button = QPushButton("閉じる")
@@ -346,29 +602,49 @@ class DictionaryWindow(QDialog):
     
     def load_dictionary_data(self):
         """辞書データの読み込み"""
-        self.table.setRowCount(0)
-        entries = self.dictionary_service.get_all_entries()
-        
-        # エントリを優先度順にソート
-        entries.sort(key=lambda x: (x.category, -x.priority, x.reading))
+        # エントリを優先度順にソートした一覧（辞書に変更がなければ並べ替え済みの結果を使い回す）
+        entries = self.dictionary_service.get_sorted_entries()
         
-        self.table.setRowCount(len(entries))
-        
-        for row, entry in enumerate(entries):
-            self.table.setItem(row, 0, QTableWidgetItem(entry.reading))
-            self.table.setItem(row, 1, QTableWidgetItem(entry.display))
-            self.table.setItem(row, 2, QTableWidgetItem(entry.category))
-            self.table.setItem(row, 3, QTableWidgetItem(str(entry.priority)))
-            self.table.setItem(row, 4, QTableWidgetItem(str(entry.usage_count)))
-            self.table.setItem(row, 5, QTableWidgetItem(entry.notes))
-            
-            # エントリオブジェクトを行に関連付け
-            item = self.table.item(row, 0)
-            if item:
-                item.setData(Qt.ItemDataRole.UserRole, entry)
+        self.table_model.set_entries(entries)
+        self._showing_search_results = False
         
         self.update_statistics()
     
+    def show_search_results(self, entries: List[DictionaryEntry]):
+        """検索結果を検索順のまま一覧に表示"""
+        self.table_model.set_entries(entries)
+        self._showing_search_results = True
+    
+    def _reload_for_entry(self, entry: DictionaryEntry) -> int:
+        """一覧全体を読み込み直し、指定エントリの行を返す（検索結果の表示中に編集した場合）"""
+        self.load_dictionary_data()
+        return self.table_model.row_of(entry.reading, entry.display)
+    
+    def _flash_status(self, message: str):
+        """操作結果のメッセージを一定時間だけ表示"""
+        self.status_label.setText(message)
+        self._status_timer.start()
+    
+    def _current_row(self) -> int:
+        """選択中の行をテーブルモデル上の行番号で取得（未選択の場合は-1）"""
+        return self.proxy_model.mapToSource(self.table.currentIndex()).row()
+    
+    def _select_row(self, row: int):
+        """テーブルモデル上の指定行を選択して表示位置までスクロール"""
+        index = self.proxy_model.mapFromSource(self.table_model.index(row, 0))
+        if index.isValid():
+            self.table.selectRow(index.row())
+            self.table.scrollTo(index)
+    
+    def _schedule_save(self):
+        """辞書の保存を予約（連続した編集は1回の保存にまとめる）"""
+        self.dictionary_service.mark_dirty()
+    
+    def done(self, result):
+        """ダイアログを閉じる際に予約中の保存を確定"""
+        self.dictionary_service.flush()
+        super().done(result)
+    
     def update_statistics(self):
         """統計情報の更新"""
         stats = self.dictionary_service.get_statistics()
@@ -387,35 +663,7 @@ class DictionaryWindow(QDialog):
     
     def filter_entries(self):
         """エントリのフィルタリング"""
-        search_text = self.search_edit.text().lower()
-        category_filter = self.category_filter.currentText()
-        
-        for row in range(self.table.rowCount()):
-            show_row = True
-            
-            # テキスト検索
-            if search_text:
-                reading_item = self.table.item(row, 0)
-                display_item = self.table.item(row, 1)
-                notes_item = self.table.item(row, 5)
-                
-                if reading_item and display_item and notes_item:
-                    reading = reading_item.text().lower()
-                    display = display_item.text().lower()
-                    notes = notes_item.text().lower()
-                    
-                    if not (search_text in reading or search_text in display or search_text in notes):
-                        show_row = False
-            
-            # カテゴリフィルタ
-            if category_filter != "全カテゴリ":
-                category_item = self.table.item(row, 2)
-                if category_item:
-                    category = category_item.text()
-                    if category != category_filter:
-                        show_row = False
-            
-            self.table.setRowHidden(row, not show_row)
+        self.proxy_model.set_filter(self.search_edit.text(), self.category_filter.currentText())
     
     def toggle_dictionary(self, enabled: bool):
         """辞書機能の有効/無効切り替え"""
@@ -428,28 +676,29 @@ class DictionaryWindow(QDialog):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             entry = dialog.get_entry_data()
             if entry and self.dictionary_service.add_entry(entry):
-                # 辞書を保存
-                self.dictionary_service.save_dictionary()
-                self.load_dictionary_data()
-                QMessageBox.information(self, "成功", "エントリを追加しました。")
+                # 辞書の保存を予約し、追加した1行だけを一覧に反映
+                self._schedule_save()
+                if self._showing_search_results:
+                    self._select_row(self._reload_for_entry(entry))
+                else:
+                    self._select_row(self.table_model.insert_entry(entry))
+                self.update_statistics()
+                self._flash_status("エントリを追加しました。")
+            elif entry and self.table_model.row_of(entry.reading, entry.display) >= 0:
+                # 既に同じエントリがある場合はその行を選択して知らせる
+                self._select_row(self.table_model.row_of(entry.reading, entry.display))
+                QMessageBox.warning(self, "エラー", "同じ読みと表記のエントリが既に存在します。")
             else:
                 QMessageBox.warning(self, "エラー", "エントリの追加に失敗しました。")
     
     def edit_entry(self):
         """エントリの編集"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        row = self._current_row()
+        entry = self.table_model.entry(row)
+        if entry is None:
             QMessageBox.warning(self, "選択エラー", "編集するエントリを選択してください。")
             return
         
-        item = self.table.item(current_row, 0)
-        if not item:
-            return
-            
-        entry = item.data(Qt.ItemDataRole.UserRole)
-        if not entry:
-            return
-        
         # 元の読みと表記を保存
         old_reading = entry.reading
         old_display = entry.display
@@ -462,10 +711,14 @@ class DictionaryWindow(QDialog):
                 if self.dictionary_service.update_entry(old_reading, old_display, updated_entry):
                     # エントリが実際に使用されたとして使用回数を更新
                     self.dictionary_service.update_entry_usage(updated_entry.reading, updated_entry.display)
-                    # 辞書を保存
-                    self.dictionary_service.save_dictionary()
-                    self.load_dictionary_data()
-                    QMessageBox.information(self, "成功", "エントリを更新しました。")
+                    # 辞書の保存を予約し、編集した1行だけを一覧に反映
+                    self._schedule_save()
+                    if self._showing_search_results:
+                        self._select_row(self._reload_for_entry(updated_entry))
+                    else:
+                        self._select_row(self.table_model.replace_entry(row, updated_entry))
+                    self.update_statistics()
+                    self._flash_status("エントリを更新しました。")
                 else:
                     QMessageBox.warning(self, "エラー", "エントリの更新に失敗しました。")
             else:
@@ -473,19 +726,12 @@ class DictionaryWindow(QDialog):
     
     def delete_entry(self):
         """エントリの削除"""
-        current_row = self.table.currentRow()
-        if current_row < 0:
+        row = self._current_row()
+        entry = self.table_model.entry(row)
+        if entry is None:
             QMessageBox.warning(self, "選択エラー", "削除するエントリを選択してください。")
             return
         
-        item = self.table.item(current_row, 0)
-        if not item:
-            return
-            
-        entry = item.data(Qt.ItemDataRole.UserRole)
-        if not entry:
-            return
-        
         reply = QMessageBox.question(
             self, "削除確認", 
             f"エントリ「{entry.reading} → {entry.display}」を削除しますか？",
@@ -494,13 +740,55 @@ class DictionaryWindow(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             if self.dictionary_service.remove_entry(entry.reading, entry.display):
-                # 辞書を保存
-                self.dictionary_service.save_dictionary()
-                self.load_dictionary_data()
-                QMessageBox.information(self, "成功", "エントリを削除しました。")
+                # 辞書の保存を予約し、削除した1行だけを一覧から取り除く
+                self._schedule_save()
+                self.table_model.remove_row(row)
+                self.update_statistics()
+                self._flash_status("エントリを削除しました。")
             else:
                 QMessageBox.warning(self, "エラー", "エントリの削除に失敗しました。")
     
+    def _start_file_thread(self, thread: QThread, title: str, message: str, on_finished,
+                           progress_dialog: Optional[QDialog] = None):
+        """ファイル処理をワーカースレッドで開始し、完了まで待機メッセージを表示
+        
+        progress_dialogを渡した場合は、待機メッセージの代わりにそのダイアログを表示する
+        """
+        if self._file_thread is not None:
+            return
+        
+        # 処理中は辞書を操作できないようウィンドウモーダルで表示
+        if progress_dialog is None:
+            progress_dialog = QMessageBox(self)
+            progress_dialog.setText(message)
+            progress_dialog.setStandardButtons(QMessageBox.StandardButton.NoButton)
+        self._progress_dialog = progress_dialog
+        self._progress_dialog.setWindowTitle(title)
+        self._progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self._progress_dialog.show()
+        
+        thread.finished.connect(on_finished)
+        thread.error.connect(self._on_file_thread_error)
+        self._file_thread = thread
+        thread.start()
+    
+    def _finish_file_thread(self):
+        """待機メッセージを閉じ、ファイル処理スレッドを解放"""
+        if self._progress_dialog:
+            self._progress_dialog.close()
+            self._progress_dialog.deleteLater()
+            self._progress_dialog = None
+        if self._file_thread:
+            self._file_thread.wait()
+            self._file_thread.deleteLater()
+            self._file_thread = None
+    
+    def _on_file_thread_error(self, error_message: str):
+        """ファイル処理スレッドでの例外を通知"""
+        self._finish_file_thread()
+        self.logger.error(f"辞書ファイルの処理中にエラーが発生しました: {error_message}")
+        QMessageBox.critical(self, "エラー", f"辞書ファイルの処理中にエラーが発生しました:\n{error_message}")
+    
     def load_dictionary(self):
         """辞書の読み込み"""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -508,19 +796,22 @@ class DictionaryWindow(QDialog):
         )
         
         if file_path:
-            if self.dictionary_service.load_dictionary(file_path):
-                self.load_dictionary_data()
-                QMessageBox.information(self, "成功", "辞書を読み込みました。")
-            else:
-                QMessageBox.warning(self, "エラー", "辞書の読み込みに失敗しました。")
+            thread = DictionaryFileThread(self.dictionary_service.load_dictionary, file_path)
+            self._start_file_thread(thread, "読み込み中", "辞書を読み込んでいます...", self._on_load_finished)
+    
+    def _on_load_finished(self, success: bool):
+        """辞書の読み込み完了時の処理"""
+        self._finish_file_thread()
+        if success:
+            self.load_dictionary_data()
+            self._flash_status("辞書を読み込みました。")
+        else:
+            QMessageBox.warning(self, "エラー", "辞書の読み込みに失敗しました。")
     
     def save_dictionary(self):
         """辞書の保存"""
-        if self.dictionary_service.save_dictionary():
-            self.update_statistics()
-            QMessageBox.information(self, "成功", "辞書を保存しました。")
-        else:
-            QMessageBox.warning(self, "エラー", "辞書の保存に失敗しました。")
+        thread = DictionaryFileThread(self.dictionary_service.save_dictionary)
+        self._start_file_thread(thread, "保存中", "辞書を保存しています...", self._on_save_finished)
     
     def save_dictionary_as(self):
         """名前を付けて辞書を保存"""
@@ -529,11 +820,17 @@ class DictionaryWindow(QDialog):
         )
         
         if file_path:
-            if self.dictionary_service.save_dictionary(file_path):
-                self.update_statistics()
-                QMessageBox.information(self, "成功", "辞書を保存しました。")
-            else:
-                QMessageBox.warning(self, "エラー", "辞書の保存に失敗しました。")
+            thread = DictionaryFileThread(self.dictionary_service.save_dictionary, file_path)
+            self._start_file_thread(thread, "保存中", "辞書を保存しています...", self._on_save_finished)
+    
+    def _on_save_finished(self, success: bool):
+        """辞書の保存完了時の処理"""
+        self._finish_file_thread()
+        if success:
+            self.update_statistics()
+            self._flash_status("辞書を保存しました。")
+        else:
+            QMessageBox.warning(self, "エラー", "辞書の保存に失敗しました。")
     
     def import_csv(self):
         """CSVのインポート"""
@@ -542,55 +839,50 @@ class DictionaryWindow(QDialog):
         )
         
         if file_path:
-            progress_dialog = None
-            try:
-                # プログレスダイアログの表示
-                progress_dialog = QMessageBox(self)
-                progress_dialog.setWindowTitle("インポート中")
-                progress_dialog.setText("CSVファイルをインポートしています...")
-                progress_dialog.setStandardButtons(QMessageBox.StandardButton.NoButton)
-                progress_dialog.show()
-                
-                # アプリケーションのイベント処理を実行
-                QApplication.processEvents()
-                
-                # インポート実行
-                success_count, duplicate_count, error_count = self.dictionary_service.import_from_csv(file_path)
-                
-                # 結果表示
-                if success_count > 0 or duplicate_count > 0:
-                    # 辞書を保存（成功した項目がある場合）
-                    if success_count > 0:
-                        self.dictionary_service.save_dictionary()
-                        self.load_dictionary_data()
-                    
-                    # 結果メッセージの作成
-                    message_parts = []
-                    if success_count > 0:
-                        message_parts.append(f"追加: {success_count}件")
-                    if duplicate_count > 0:
-                        message_parts.append(f"重複スキップ: {duplicate_count}件")
-                    if error_count > 0:
-                        message_parts.append(f"エラー: {error_count}件")
-                    
-                    message = "\n".join(message_parts)
-                    
-                    if error_count > 0:
-                        QMessageBox.warning(self, "インポート完了（一部エラー）", message)
-                    else:
-                        QMessageBox.information(self, "インポート完了", message)
-                else:
-                    QMessageBox.warning(self, "エラー", f"CSVのインポートに失敗しました。\nエラー: {error_count}件")
-                    
-            except Exception as e:
-                self.logger.error(f"CSVインポート中にエラーが発生しました: {str(e)}")
-                QMessageBox.critical(self, "エラー", f"CSVインポート中にエラーが発生しました:\n{str(e)}")
-            finally:
-                # プログレスダイアログを確実に閉じる
-                if progress_dialog:
-                    progress_dialog.close()
-                    progress_dialog.deleteLater()
-                    QApplication.processEvents()
+            # インポートと保存はワーカースレッドで実行（処理済みの行数を表示し、キャンセルで中断）
+            thread = DictionaryImportThread(self.dictionary_service, file_path)
+            progress_dialog = QProgressDialog("CSVファイルをインポートしています...", "キャンセル", 0, 0, self)
+            progress_dialog.setMinimumDuration(0)
+            progress_dialog.canceled.connect(thread.requestInterruption)
+            thread.progress.connect(self._on_import_progress)
+            # 取り込んだエントリは完了を待たずに一覧の末尾へ表示（完了時に並べ替える）
+            thread.entries_added.connect(self.table_model.append_entries)
+            self._start_file_thread(
+                thread, "インポート中", "CSVファイルをインポートしています...",
+                self._on_import_finished, progress_dialog
+            )
+    
+    def _on_import_progress(self, processed_rows: int):
+        """CSVのインポートの進捗を表示"""
+        if isinstance(self._progress_dialog, QProgressDialog):
+            self._progress_dialog.setLabelText(f"CSVファイルをインポートしています...（{processed_rows}行）")
+    
+    def _on_import_finished(self, success_count: int, duplicate_count: int, error_count: int):
+        """CSVのインポート完了時の処理"""
+        self._finish_file_thread()
+        
+        # 結果表示
+        if success_count > 0 or duplicate_count > 0:
+            if success_count > 0:
+                self.load_dictionary_data()
+            
+            # 結果メッセージの作成
+            message_parts = []
+            if success_count > 0:
+                message_parts.append(f"追加: {success_count}件")
+            if duplicate_count > 0:
+                message_parts.append(f"重複スキップ: {duplicate_count}件")
+            if error_count > 0:
+                message_parts.append(f"エラー: {error_count}件")
+            
+            message = "\n".join(message_parts)
+            
+            if error_count > 0:
+                QMessageBox.warning(self, "インポート完了（一部エラー）", message)
+            else:
+                self._flash_status(f"インポート完了: {'、'.join(message_parts)}")
+        else:
+            QMessageBox.warning(self, "エラー", f"CSVのインポートに失敗しました。\nエラー: {error_count}件")
     
     def export_csv(self):
         """CSVのエクスポート"""
@@ -599,10 +891,16 @@ class DictionaryWindow(QDialog):
         )
         
         if file_path:
-            if self.dictionary_service.export_to_csv(file_path):
-                QMessageBox.information(self, "成功", "CSVファイルにエクスポートしました。")
-            else:
-                QMessageBox.warning(self, "エラー", "CSVのエクスポートに失敗しました。")
+            thread = DictionaryFileThread(self.dictionary_service.export_to_csv, file_path)
+            self._start_file_thread(thread, "エクスポート中", "CSVファイルにエクスポートしています...", self._on_export_finished)
+    
+    def _on_export_finished(self, success: bool):
+        """CSVのエクスポート完了時の処理"""
+        self._finish_file_thread()
+        if success:
+            self._flash_status("CSVファイルにエクスポートしました。")
+        else:
+            QMessageBox.warning(self, "エラー", "CSVのエクスポートに失敗しました。")
     
     def show_detailed_statistics(self):
         """詳細統計を表示"""
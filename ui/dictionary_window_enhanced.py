@@ -1,19 +1,56 @@
 import sys
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget,
     QPushButton, QLineEdit, QComboBox, QSpinBox, QTextEdit, QLabel,
     QGroupBox, QFileDialog, QMessageBox, QHeaderView, QCheckBox,
     QSplitter, QWidget, QFormLayout, QProgressBar, QApplication,
-    QTabWidget, QTreeWidget, QTreeWidgetItem, QDateEdit, QSlider
+    QTabWidget, QTreeView, QDateEdit, QSlider
 )
-from PySide6.QtCore import Qt, QThread, Signal, QDate
+from PySide6.QtCore import Qt, QThread, Signal, QDate, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QFont, QIcon
 from pathlib import Path
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Sequence
 from services.dictionary import DictionaryService, DictionaryEntry, CategoryManager
 from utils.logger import Logger
 
+class StatisticsTableModel(QAbstractTableModel):
+    """統計の一覧表示用の読み取り専用モデル（表示用の文字列の行をそのまま返す）"""
+    
+    def __init__(self, headers: List[str], parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows: List[Sequence[str]] = []
+    
+    def set_rows(self, rows: List[Sequence[str]]):
+        """表示する行をまとめて差し替え"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if index.isValid() and role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self._headers[section]
+        return None
+
+def _create_statistics_view(model: StatisticsTableModel) -> QTreeView:
+    """統計の一覧表示用のビューを作成"""
+    view = QTreeView()
+    view.setRootIsDecorated(False)
+    view.setUniformRowHeights(True)
+    view.setModel(model)
+    return view
+
 class DetailedStatisticsDialog(QDialog):
     """詳細統計表示ダイアログ"""
     
@@ -39,8 +76,8 @@ class DetailedStatisticsDialog(QDialog):
         usage_layout = QVBoxLayout(usage_tab)
         
         usage_layout.addWidget(QLabel("使用頻度ランキング（上位10件）"))
-        self.usage_tree = QTreeWidget()
-        self.usage_tree.setHeaderLabels(["順位", "読み", "表記", "カテゴリ", "使用回数"])
+        self.usage_model = StatisticsTableModel(["順位", "読み", "表記", "カテゴリ", "使用回数"], self)
+        self.usage_tree = _create_statistics_view(self.usage_model)
         usage_layout.addWidget(self.usage_tree)
         
         tab_widget.addTab(usage_tab, "使用頻度")
@@ -50,8 +87,8 @@ class DetailedStatisticsDialog(QDialog):
         recent_layout = QVBoxLayout(recent_tab)
         
         recent_layout.addWidget(QLabel("最近追加されたエントリ（上位10件）"))
-        self.recent_tree = QTreeWidget()
-        self.recent_tree.setHeaderLabels(["読み", "表記", "カテゴリ", "作成日時"])
+        self.recent_model = StatisticsTableModel(["読み", "表記", "カテゴリ", "作成日時"], self)
+        self.recent_tree = _create_statistics_view(self.recent_model)
         recent_layout.addWidget(self.recent_tree)
         
         tab_widget.addTab(recent_tab, "最近追加")
@@ -61,71 +98,108 @@ class DetailedStatisticsDialog(QDialog):
         category_layout = QVBoxLayout(category_tab)
         
         category_layout.addWidget(QLabel("カテゴリ別統計"))
-        self.category_tree = QTreeWidget()
-        self.category_tree.setHeaderLabels(["カテゴリ", "エントリ数", "総使用回数", "平均優先度", "最多使用エントリ"])
+        self.category_model = StatisticsTableModel(
+            ["カテゴリ", "エントリ数", "総使用回数", "平均優先度", "最多使用エントリ"], self
+        )
+        self.category_tree = _create_statistics_view(self.category_model)
         category_layout.addWidget(self.category_tree)
         
         tab_widget.addTab(category_tab, "カテゴリ別")
         
         layout.addWidget(tab_widget)
         
+        # 各タブの一覧は初めて表示した時に作成する
+        self._tab_loaders = [self._load_usage, self._load_recent, self._load_category]
+        self._loaded_tabs = set()
+        self._detailed_stats = None
+        self.tab_widget = tab_widget
+        tab_widget.currentChanged.connect(self._load_tab)
+        
         # 閉じるボタン
         close_button = QPushButton("閉じる")
         close_button.clicked.connect(self.accept)
         layout.addWidget(close_button)
     
     def load_statistics(self):
-        """統計データの読み込み"""
-        detailed_stats = self.dictionary_service.get_detailed_statistics()
-        
-        # 使用頻度ランキング
-        self.usage_tree.clear()
+        """統計データの読み込み（表示中のタブの分のみ作成し、他のタブは表示時に作成する）"""
+        self._detailed_stats = None
+        self._loaded_tabs.clear()
+        self._load_tab(self.tab_widget.currentIndex())
+    
+    def _load_tab(self, index: int):
+        """指定したタブの一覧を未作成の場合のみ作成"""
+        if index < 0 or index in self._loaded_tabs:
+            return
+        self._loaded_tabs.add(index)
+        
+        if self._detailed_stats is None:
+            self._detailed_stats = self.dictionary_service.get_detailed_statistics()
+        self._tab_loaders[index](self._detailed_stats)
+    
+    def _load_usage(self, detailed_stats: Dict):
+        """使用頻度ランキングの一覧を作成"""
+        usage_rows = []
         for i, entry in enumerate(detailed_stats["usage_ranking"], 1):
-            item = QTreeWidgetItem([
+            usage_rows.append((
                 str(i),
                 entry["reading"],
                 entry["display"],
                 entry["category"],
                 str(entry["usage_count"])
-            ])
-            self.usage_tree.addTopLevelItem(item)
-        
-        # 最近追加されたエントリ
-        self.recent_tree.clear()
+            ))
+        self.usage_model.set_rows(usage_rows)
+    
+    def _load_recent(self, detailed_stats: Dict):
+        """最近追加されたエントリの一覧を作成"""
+        recent_rows = []
         for entry in detailed_stats["recent_entries"]:
-            # ISO形式の日時を読みやすい形式に変換
-            try:
-                created_dt = datetime.fromisoformat(entry["created_at"])
-                created_str = created_dt.strftime("%Y-%m-%d %H:%M")
-            except:
-                created_str = entry["created_at"]
+            # ISO形式の日時を読みやすい形式に変換（"YYYY-MM-DDTHH:MM"までを切り出すだけで済ませる）
+            created_at = entry["created_at"]
+            if len(created_at) >= 16 and created_at[4] == "-" and created_at[10] == "T":
+                created_str = created_at[:10] + " " + created_at[11:16]
+            else:
+                created_str = created_at
             
-            item = QTreeWidgetItem([
+            recent_rows.append((
                 entry["reading"],
                 entry["display"],
                 entry["category"],
                 created_str
-            ])
-            self.recent_tree.addTopLevelItem(item)
-        
-        # カテゴリ別統計
-        self.category_tree.clear()
+            ))
+        self.recent_model.set_rows(recent_rows)
+    
+    def _load_category(self, detailed_stats: Dict):
+        """カテゴリ別統計の一覧を作成"""
+        category_rows = []
         for category, details in detailed_stats["category_details"].items():
             most_used = details["most_used"]
             most_used_str = f"{most_used['reading']} → {most_used['display']} ({most_used['usage_count']}回)" if most_used else "なし"
             
-            item = QTreeWidgetItem([
+            category_rows.append((
                 category,
                 str(details["count"]),
                 str(details["total_usage"]),
                 f"{details['avg_priority']:.1f}",
                 most_used_str
-            ])
-            self.category_tree.addTopLevelItem(item)
+            ))
+        self.category_model.set_rows(category_rows)
 
 class AdvancedSearchDialog(QDialog):
     """高度な検索ダイアログ"""
     
+    # ソート設定の表示名と検索パラメータの値
+    SORT_BY_OPTIONS = (
+        ("優先度", "priority"),
+        ("使用回数", "usage_count"),
+        ("作成日時", "created_at"),
+        ("読み", "reading"),
+        ("表記", "display"),
+    )
+    SORT_ORDER_OPTIONS = (
+        ("降順", "desc"),
+        ("昇順", "asc"),
+    )
+    
     def __init__(self, dictionary_service: DictionaryService, parent=None):
         super().__init__(parent)
         self.dictionary_service = dictionary_service
@@ -186,11 +260,13 @@ class AdvancedSearchDialog(QDialog):
         # ソート設定
         sort_layout = QHBoxLayout()
         self.sort_by_combo = QComboBox()
-        self.sort_by_combo.addItems(["優先度", "使用回数", "作成日時", "読み", "表記"])
+        for label, key in self.SORT_BY_OPTIONS:
+            self.sort_by_combo.addItem(label, key)
         sort_layout.addWidget(self.sort_by_combo)
         
         self.sort_order_combo = QComboBox()
-        self.sort_order_combo.addItems(["降順", "昇順"])
+        for label, key in self.SORT_ORDER_OPTIONS:
+            self.sort_order_combo.addItem(label, key)
         sort_layout.addWidget(self.sort_order_combo)
         sort_widget = QWidget()
         sort_widget.setLayout(sort_layout)
@@ -213,20 +289,6 @@ class AdvancedSearchDialog(QDialog):
     
     def get_search_params(self):
         """検索パラメータを取得"""
-        # ソート設定の変換
-        sort_by_map = {
-            "優先度": "priority",
-            "使用回数": "usage_count", 
-            "作成日時": "created_at",
-            "読み": "reading",
-            "表記": "display"
-        }
-        
-        sort_order_map = {
-            "降順": "desc",
-            "昇順": "asc"
-        }
-        
         return {
             "query": self.query_edit.text().strip(),
             "category": self.category_combo.currentText() if self.category_combo.currentText() != "全カテゴリ" else None,
@@ -234,8 +296,8 @@ class AdvancedSearchDialog(QDialog):
             "max_usage": self.max_usage_spin.value() if self.max_usage_spin.value() < 1000 else None,
             "min_priority": self.min_priority_spin.value(),
             "max_priority": self.max_priority_spin.value(),
-            "sort_by": sort_by_map[self.sort_by_combo.currentText()],
-            "sort_order": sort_order_map[self.sort_order_combo.currentText()]
+            "sort_by": self.sort_by_combo.currentData(),
+            "sort_order": self.sort_order_combo.currentData()
         }
 
 # 既存のDictionaryWindowクラスに機能を追加するための拡張
@@ -243,16 +305,19 @@ class DictionaryWindowEnhanced:
     """辞書管理ウィンドウの拡張機能"""
     
     @staticmethod
-    def add_enhanced_features(window):
-        """既存のDictionaryWindowに拡張機能を追加"""
+    def add_enhanced_features(window, toolbar_layout: Optional[QHBoxLayout] = None):
+        """既存のDictionaryWindowに拡張機能を追加
+        
+        toolbar_layoutを省略した場合はウィンドウのツールバーに追加する
+        """
         # 高度な検索ボタンを追加
         advanced_search_button = QPushButton("高度な検索")
         advanced_search_button.clicked.connect(lambda: DictionaryWindowEnhanced.show_advanced_search(window))
         
         # ツールバーに追加（既存の検索エリアの後に）
-        toolbar_layout = window.findChild(QHBoxLayout)
-        if toolbar_layout:
-            toolbar_layout.addWidget(advanced_search_button)
+        if toolbar_layout is None:
+            toolbar_layout = window.toolbar_layout
+        toolbar_layout.addWidget(advanced_search_button)
     
     @staticmethod
     def show_advanced_search(parent_window):
@@ -270,21 +335,7 @@ class DictionaryWindowEnhanced:
     @staticmethod
     def display_search_results(parent_window, results):
         """検索結果をテーブルに表示"""
-        table = parent_window.table
-        table.setRowCount(len(results))
-        
-        for row, entry in enumerate(results):
-            table.setItem(row, 0, QTableWidgetItem(entry.reading))
-            table.setItem(row, 1, QTableWidgetItem(entry.display))
-            table.setItem(row, 2, QTableWidgetItem(entry.category))
-            table.setItem(row, 3, QTableWidgetItem(str(entry.priority)))
-            table.setItem(row, 4, QTableWidgetItem(str(entry.usage_count)))
-            table.setItem(row, 5, QTableWidgetItem(entry.notes))
-            
-            # エントリオブジェクトを行に関連付け
-            item = table.item(row, 0)
-            if item:
-                item.setData(Qt.ItemDataRole.UserRole, entry)
+        parent_window.show_search_results(results)
         
         # 検索結果の件数を表示
         QMessageBox.information(parent_window, "検索完了", f"検索結果: {len(results)}件のエントリが見つかりました。")
@@ -4,21 +4,103 @@ from PySide6.QtWidgets import (
     QSpinBox, QDoubleSpinBox, QCheckBox, QGroupBox, QFormLayout, QProgressBar,
     QComboBox, QStatusBar, QDialog
 )
-from PySide6.QtCore import Qt, QTimer, Signal, Slot, QPoint, QSize
-from PySide6.QtGui import QIcon
-import threading
-import time
+from PySide6.QtCore import Qt, QTimer, Signal, Slot, QPoint, QSize, QSignalBlocker
+from PySide6.QtGui import QIcon, QStandardItemModel, QStandardItem
 import os
+from concurrent.futures import ThreadPoolExecutor
 import subprocess
 from utils.settings import Settings
 from utils.logger import Logger
 
+# ボタンのスタイルシート（ウィンドウの生成ごとに文字列を組み立てないようモジュールで定義）
+_RECORD_BUTTON_QSS = """
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 10px;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+_STOP_BUTTON_QSS = """
+    QPushButton {
+        background-color: #f44336;
+        color: white;
+        border: none;
+        padding: 10px;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #da190b;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+_CANCEL_BUTTON_QSS = """
+    QPushButton {
+        background-color: #FF9800;
+        color: white;
+        border: none;
+        padding: 10px;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #F57C00;
+    }
+    QPushButton:disabled {
+        background-color: #cccccc;
+    }
+"""
+
+_CLEAR_BUTTON_QSS = """
+    QPushButton {
+        background-color: #9E9E9E;
+        color: white;
+        border: none;
+        padding: 10px;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #757575;
+    }
+"""
+
+_OPEN_FOLDER_BUTTON_QSS = """
+    QPushButton {
+        background-color: #2196F3;
+        color: white;
+        border: none;
+        padding: 10px;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background-color: #0b7dda;
+    }
+"""
+
+
 class MainWindow(QMainWindow):
     # シグナル定義
     transcription_complete = Signal(str)
     recording_status_changed = Signal(bool)
     silence_detected = Signal()
     status_changed = Signal(str)  # ステータス変更用のシグナル
+    transcription_failed = Signal(str)  # 文字起こしのエラー通知用のシグナル
+    transcription_finished = Signal()  # 文字起こし処理の終了通知用のシグナル
     
     def __init__(self, recorder, transcription_service, clipboard_module):
         """メインウィンドウの初期化
@@ -36,14 +118,26 @@ class MainWindow(QMainWindow):
         self.settings = Settings()
         self.logger = Logger.get_logger(__name__)
         
-        self.recording_thread = None
-        self.transcription_thread = None
+        # 文字起こし用のワーカースレッド（録音ごとにスレッドを作らず使い回す）
+        self._transcription_executor = ThreadPoolExecutor(max_workers=1)
         self.is_recording = False
         self.is_processing = False  # 処理中フラグ
         
-        # 無音検出用のタイマー
-        self.silence_timer = QTimer()
-        self.silence_timer.timeout.connect(self.check_silence)
+        # 無音検出はレコーダーのコールバックから通知を受ける（シグナル経由でGUIスレッドに渡す）
+        self.recorder.silence_callback = self.silence_detected.emit
+        
+        # 無音検出の設定の保存（スピンボックスの連続した変更は最後の1回にまとめて保存する）
+        self._silence_settings_timer = QTimer(self)
+        self._silence_settings_timer.setSingleShot(True)
+        self._silence_settings_timer.setInterval(300)
+        self._silence_settings_timer.timeout.connect(self._save_silence_settings)
+        
+        # ステータスバーの更新（続けて届いたメッセージは最後の1件だけを表示する）
+        self._pending_status = ""
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._show_pending_status)
         
         self.init_ui()
         self.load_settings()
@@ -56,9 +150,11 @@ class MainWindow(QMainWindow):
         if saved_model:
             try:
                 self.transcription_service.set_model(saved_model)
-                index = self.model_combo.findData(saved_model)
+                index = self._model_index.get(saved_model, -1)
                 if index >= 0:
-                    self.model_combo.setCurrentIndex(index)
+                    # 読み込んだ設定を反映するだけなので、変更時の処理（モデルの切り替えと保存）は行わない
+                    with QSignalBlocker(self.model_combo):
+                        self.model_combo.setCurrentIndex(index)
             except ValueError:
                 pass
         
@@ -67,9 +163,11 @@ class MainWindow(QMainWindow):
         if saved_mode:
             try:
                 self.transcription_service.set_mode(saved_mode)
-                index = self.mode_combo.findData(saved_mode)
+                index = self._mode_index.get(saved_mode, -1)
                 if index >= 0:
-                    self.mode_combo.setCurrentIndex(index)
+                    # 読み込んだ設定を反映するだけなので、変更時の処理（モデルの切り替えと保存）は行わない
+                    with QSignalBlocker(self.mode_combo):
+                        self.mode_combo.setCurrentIndex(index)
             except ValueError:
                 pass
         
@@ -78,21 +176,34 @@ class MainWindow(QMainWindow):
         self.silence_threshold_spinbox.setValue(self.settings.get("silence_threshold", 0.01))
         self.silence_duration_spinbox.setValue(self.settings.get("silence_duration", 20))
         
-        # 録音クラスの設定を更新
-        self.update_silence_settings()
+        # 録音クラスの設定を更新（読み込んだ値をそのまま保存し直す必要はない）
+        self._apply_silence_to_recorder()
     
     def save_settings(self):
         """現在の設定を保存する"""
-        # モデルの設定
-        self.settings.set("model", self.transcription_service.get_current_model())
-        
-        # 文字起こしモードの設定
-        self.settings.set("transcription_mode", self.transcription_service.get_current_mode())
+        self.settings.update({
+            # モデルの設定
+            "model": self.transcription_service.get_current_model(),
+            # 文字起こしモードの設定
+            "transcription_mode": self.transcription_service.get_current_mode(),
+            # 無音検出の設定
+            "silence_detection": self.silence_detection_checkbox.isChecked(),
+            "silence_threshold": self.silence_threshold_spinbox.value(),
+            "silence_duration": self.silence_duration_spinbox.value(),
+        })
+    
+    def _build_combo_model(self, items):
+        """コンボボックス用のモデルをまとめて作成する（項目ごとのモデル更新を避ける）
         
-        # 無音検出の設定
-        self.settings.set("silence_detection", self.silence_detection_checkbox.isChecked())
-        self.settings.set("silence_threshold", self.silence_threshold_spinbox.value())
-        self.settings.set("silence_duration", self.silence_duration_spinbox.value())
+        Args:
+            items: (表示名, データ) のタプルの列
+        """
+        model = QStandardItemModel(self)
+        for label, data in items:
+            item = QStandardItem(label)
+            item.setData(data, Qt.UserRole)
+            model.appendRow(item)
+        return model
     
     def init_ui(self):
         """UIの初期化"""
@@ -130,12 +241,16 @@ class MainWindow(QMainWindow):
         # モデル選択コンボボックス
         self.model_combo = QComboBox()
         available_models = self.transcription_service.get_available_models()
-        for model_name, description in available_models.items():
-            self.model_combo.addItem(f"{model_name} - {description}", model_name)
+        self.model_combo.setModel(self._build_combo_model(
+            (f"{model_name} - {description}", model_name)
+            for model_name, description in available_models.items()
+        ))
+        # モデル名からコンボボックスの位置を引く辞書（findDataによる走査を省く）
+        self._model_index = {model_name: i for i, model_name in enumerate(available_models)}
         
         # 現在のモデルを選択
         current_model = self.transcription_service.get_current_model()
-        index = self.model_combo.findData(current_model)
+        index = self._model_index.get(current_model, -1)
         if index >= 0:
             self.model_combo.setCurrentIndex(index)
         
@@ -144,12 +259,16 @@ class MainWindow(QMainWindow):
         # 文字起こしモード選択コンボボックス
         self.mode_combo = QComboBox()
         available_modes = self.transcription_service.get_available_modes()
-        for mode_id, mode_info in available_modes.items():
-            self.mode_combo.addItem(f"{mode_info['name']} - {mode_info['description']}", mode_id)
+        self.mode_combo.setModel(self._build_combo_model(
+            (f"{mode_info['name']} - {mode_info['description']}", mode_id)
+            for mode_id, mode_info in available_modes.items()
+        ))
+        # モードIDからコンボボックスの位置を引く辞書
+        self._mode_index = {mode_id: i for i, mode_id in enumerate(available_modes)}
         
         # 現在のモードを選択
         current_mode = self.transcription_service.get_current_mode()
-        index = self.mode_combo.findData(current_mode)
+        index = self._mode_index.get(current_mode, -1)
         if index >= 0:
             self.mode_combo.setCurrentIndex(index)
         
@@ -201,100 +320,31 @@ class MainWindow(QMainWindow):
         
         # 録音ボタン
         self.record_button = QPushButton("録音開始")
-        self.record_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.record_button.setStyleSheet(_RECORD_BUTTON_QSS)
         button_layout.addWidget(self.record_button)
         
         # 停止ボタン
         self.stop_button = QPushButton("録音停止")
         self.stop_button.setEnabled(False)
-        self.stop_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.stop_button.setStyleSheet(_STOP_BUTTON_QSS)
         button_layout.addWidget(self.stop_button)
         
         # キャンセルボタン
         self.cancel_button = QPushButton("録音キャンセル")
         self.cancel_button.setEnabled(False)
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #FF9800;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #F57C00;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-            }
-        """)
+        self.cancel_button.setStyleSheet(_CANCEL_BUTTON_QSS)
         button_layout.addWidget(self.cancel_button)
         
         # クリアボタン
         self.clear_button = QPushButton("一時ファイルを削除")
-        self.clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: #9E9E9E;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #757575;
-            }
-        """)
+        self.clear_button.setStyleSheet(_CLEAR_BUTTON_QSS)
         button_layout.addWidget(self.clear_button)
         
         # フォルダーを開くボタン
         self.open_folder_button = QPushButton("📁")
         self.open_folder_button.setToolTip("一時ファイルフォルダーを開く")
         self.open_folder_button.setFixedWidth(40)  # 幅を小さく設定
-        self.open_folder_button.setStyleSheet("""
-            QPushButton {
-                background-color: #2196F3;
-                color: white;
-                border: none;
-                padding: 10px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #0b7dda;
-            }
-        """)
+        self.open_folder_button.setStyleSheet(_OPEN_FOLDER_BUTTON_QSS)
         button_layout.addWidget(self.open_folder_button)
         
         main_layout.addLayout(button_layout)
@@ -314,9 +364,12 @@ class MainWindow(QMainWindow):
         self.mode_combo.currentIndexChanged.connect(self.change_mode)
         
         # カスタムシグナル
-        self.transcription_complete.connect(self.update_transcription)
         self.recording_status_changed.connect(self.update_recording_status)
-        self.silence_detected.connect(self.handle_silence_detection)
+        # ワーカースレッド・PortAudioのスレッドから発行されるシグナルは常にGUIスレッドのキューを経由させる
+        self.transcription_complete.connect(self.update_transcription, Qt.QueuedConnection)
+        self.silence_detected.connect(self.handle_silence_detection, Qt.QueuedConnection)
+        self.transcription_failed.connect(self.show_transcription_error, Qt.QueuedConnection)
+        self.transcription_finished.connect(self.finish_transcription, Qt.QueuedConnection)
         
         # 設定変更時の接続
         self.silence_detection_checkbox.stateChanged.connect(self.update_silence_settings)
@@ -346,9 +399,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "エラー", str(e))
             # 元のモデルに戻す
             current_model = self.transcription_service.get_current_model()
-            index = self.model_combo.findData(current_model)
+            index = self._model_index.get(current_model, -1)
             if index >= 0:
-                self.model_combo.setCurrentIndex(index)
+                with QSignalBlocker(self.model_combo):
+                    self.model_combo.setCurrentIndex(index)
     
     def change_mode(self, index):
         """文字起こしモードを変更する
@@ -364,30 +418,51 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "エラー", str(e))
             # 元のモードに戻す
             current_mode = self.transcription_service.get_current_mode()
-            index = self.mode_combo.findData(current_mode)
+            index = self._mode_index.get(current_mode, -1)
             if index >= 0:
-                self.mode_combo.setCurrentIndex(index)
+                with QSignalBlocker(self.mode_combo):
+                    self.mode_combo.setCurrentIndex(index)
     
     def update_silence_settings(self):
         """無音検出の設定を更新"""
+        self._apply_silence_to_recorder()
+        # 設定の保存は変更が落ち着いてから行う
+        self._silence_settings_timer.start()
+    
+    def _apply_silence_to_recorder(self):
+        """画面の無音検出の設定を録音クラスに反映（保存は行わない）"""
         if self.silence_detection_checkbox.isChecked():
             self.recorder.silence_threshold = self.silence_threshold_spinbox.value()
             self.recorder.silence_duration = self.silence_duration_spinbox.value()
-            # 設定を保存
-            self.settings.set("silence_threshold", self.silence_threshold_spinbox.value())
-            self.settings.set("silence_duration", self.silence_duration_spinbox.value())
-            self.settings.set("silence_detection", True)
+    
+    def _save_silence_settings(self):
+        """無音検出の設定を保存"""
+        if self.silence_detection_checkbox.isChecked():
+            self.settings.update({
+                "silence_threshold": self.silence_threshold_spinbox.value(),
+                "silence_duration": self.silence_duration_spinbox.value(),
+                "silence_detection": True,
+            })
         else:
             self.settings.set("silence_detection", False)
     
     def start_recording(self):
         """録音を開始"""
         if not self.is_recording and not self.is_processing:
+            # 録音データはレコーダーのストリームコールバック（PortAudioのスレッド）で処理されるため、
+            # 録音の間待機し続けるワーカースレッドは使わずに録音を開始する
+            try:
+                success = self.recorder.start_recording()
+            except Exception as e:
+                self.status_changed.emit(f"録音中にエラーが発生しました: {str(e)}")
+                return
+            if not success:
+                self.status_changed.emit("録音を開始できませんでした")
+                return
+            
             self.is_recording = True
             self.recording_status_changed.emit(True)
             self.status_changed.emit("録音中...")
-            self.recording_thread = threading.Thread(target=self.recording_worker)
-            self.recording_thread.start()
     
     def stop_recording(self):
         """録音を停止"""
@@ -422,7 +497,8 @@ class MainWindow(QMainWindow):
             try:
                 audio_file = self.recorder.stop_recording()
                 if audio_file:
-                    # 音声ファイルを削除
+                    # 書き出しの完了を待ってから音声ファイルを削除
+                    self.recorder.wait_ready()
                     import os
                     if os.path.exists(audio_file):
                         os.remove(audio_file)
@@ -432,42 +508,10 @@ class MainWindow(QMainWindow):
                 self.logger.error(f"録音キャンセル中にエラーが発生しました: {str(e)}")
                 self.status_changed.emit(f"エラー: {str(e)}")
     
-    def recording_worker(self):
-        """録音ワーカースレッド"""
-        try:
-            # 録音を開始
-            success = self.recorder.start_recording()
-            if not success:
-                self.status_changed.emit("録音を開始できませんでした")
-                self.is_recording = False
-                self.recording_status_changed.emit(False)
-                return
-            
-            # 無音検出タイマー開始
-            if self.silence_detection_checkbox.isChecked():
-                self.silence_timer.start(1000)  # 1秒ごとにチェック
-            
-            # 録音ループ
-            while self.is_recording:
-                self.recorder.record_frame()
-                time.sleep(0.01)  # CPU使用率を下げるためのスリープ
-        except Exception as e:
-            self.status_changed.emit(f"録音中にエラーが発生しました: {str(e)}")
-            self.is_recording = False
-            self.recording_status_changed.emit(False)
-        finally:
-            # 無音検出タイマーを停止
-            self.silence_timer.stop()
-    
-    def check_silence(self):
-        """無音検出のチェック"""
-        if self.is_recording and self.recorder.is_silence_detected():
-            self.silence_detected.emit()
-    
     @Slot()
     def handle_silence_detection(self):
         """無音検出時の処理"""
-        if self.is_recording:
+        if self.is_recording and self.silence_detection_checkbox.isChecked():
             self.stop_recording()
             QMessageBox.information(self, "無音検出", "一定時間の無音が検出されたため、録音を停止しました。")
     
@@ -482,11 +526,7 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # インディケーターモード
         
-        self.transcription_thread = threading.Thread(
-            target=self.transcription_worker,
-            args=(audio_file,)
-        )
-        self.transcription_thread.start()
+        self._transcription_executor.submit(self.transcription_worker, audio_file)
     
     def transcription_worker(self, audio_file):
         """文字起こし処理を実行
@@ -495,20 +535,37 @@ class MainWindow(QMainWindow):
             audio_file (str): 音声ファイルのパス
         """
         try:
+            # 録音ファイルの書き出し完了を待つ
+            self.recorder.wait_ready()
             result = self.transcription_service.transcribe_audio(audio_file)
             if result.startswith("文字起こし中にエラーが発生しました"):
                 self.status_changed.emit(result)
-                QMessageBox.warning(self, "エラー", result)
+                self.transcription_failed.emit(result)
             else:
                 self.transcription_complete.emit(result)
         except Exception as e:
             error_msg = str(e)
             self.status_changed.emit(error_msg)
-            QMessageBox.warning(self, "エラー", error_msg)
+            self.transcription_failed.emit(error_msg)
         finally:
-            self.is_processing = False
-            self.progress_bar.setVisible(False)
-            self.status_changed.emit("準備完了")
+            # UIの更新はワーカースレッドから直接行わず、シグナル経由でGUIスレッドに任せる
+            self.transcription_finished.emit()
+    
+    @Slot(str)
+    def show_transcription_error(self, message):
+        """文字起こしのエラーを表示
+        
+        Args:
+            message (str): エラーメッセージ
+        """
+        QMessageBox.warning(self, "エラー", message)
+    
+    @Slot()
+    def finish_transcription(self):
+        """文字起こし処理の終了時の処理"""
+        self.is_processing = False
+        self.progress_bar.setVisible(False)
+        self.status_changed.emit("準備完了")
     
     @Slot(str)
     def update_transcription(self, text):
@@ -563,17 +620,21 @@ class MainWindow(QMainWindow):
             # キャンセル処理を実行（文字起こしを行わない）
             self.cancel_recording()
         
-        # 無音検出タイマーを停止
-        self.silence_timer.stop()
-        
         # ウィンドウの位置とサイズを保存
-        if not self.isMaximized():
+        is_maximized = self.isMaximized()
+        if not is_maximized:
             self.settings.set_window_geometry(self.pos(), self.size())
-        self.settings.set_window_state(self.isMaximized())
+        self.settings.set_window_state(is_maximized)
+        # QSettingsへの書き込みはここで1回だけまとめて反映する
+        self.settings.save()
         
-        # その他の設定を保存
+        # その他の設定を保存（保存待ちの無音検出の設定もここで1回の書き込みで保存される）
+        self._silence_settings_timer.stop()
         self.save_settings()
         
+        # 文字起こしのワーカースレッドを終了（実行中の処理は完了まで続ける）
+        self._transcription_executor.shutdown(wait=False)
+        
         # イベントを受け入れる
         event.accept()
 
@@ -613,12 +674,18 @@ class MainWindow(QMainWindow):
     
     @Slot(str)
     def update_status(self, message):
-        """ステータスメッセージを更新
+        """ステータスメッセージを更新（表示は少し遅らせてまとめて行う）
         
         Args:
             message (str): 表示するメッセージ
         """
-        self.status_bar.showMessage(message)
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _show_pending_status(self):
+        """保留中のステータスメッセージを表示"""
+        self.status_bar.showMessage(self._pending_status)
     
     def open_dictionary_window(self):
         """辞書管理ウィンドウを開く"""
@@ -639,15 +706,8 @@ class MainWindow(QMainWindow):
             advanced_search_button = QPushButton("高度な検索")
             advanced_search_button.clicked.connect(lambda: self.show_advanced_search(dialog))
             
-            # ツールバーレイアウトを取得して追加
-            toolbar_layout = None
-            for child in dialog.findChildren(QHBoxLayout):
-                if child.parent() == dialog:
-                    toolbar_layout = child
-                    break
-            
-            if toolbar_layout:
-                toolbar_layout.addWidget(advanced_search_button)
+            # ツールバーに追加
+            dialog.toolbar_layout.addWidget(advanced_search_button)
         except Exception as e:
             self.logger.warning(f"拡張機能の追加中にエラーが発生しました: {str(e)}")
     
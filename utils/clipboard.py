@@ -1,23 +1,77 @@
+import ctypes
+from ctypes import wintypes
 import win32clipboard
 import win32con
 import win32gui
-import win32api
-import time
 from utils.logger import Logger
 
 logger = Logger("speech_to_text").get_logger(__name__)
 
+_user32 = ctypes.WinDLL("user32", use_last_error=True)
+
+INPUT_KEYBOARD = 1
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ("wVk", wintypes.WORD),
+        ("wScan", wintypes.WORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_void_p),
+    ]
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ("dx", wintypes.LONG),
+        ("dy", wintypes.LONG),
+        ("mouseData", wintypes.DWORD),
+        ("dwFlags", wintypes.DWORD),
+        ("time", wintypes.DWORD),
+        ("dwExtraInfo", ctypes.c_void_p),
+    ]
+
+class _INPUT_UNION(ctypes.Union):
+    # INPUT構造体の大きさを合わせるため、最も大きいMOUSEINPUTも含める
+    _fields_ = [("ki", _KEYBDINPUT), ("mi", _MOUSEINPUT)]
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD), ("union", _INPUT_UNION)]
+
+def _key_input(vk, flags=0):
+    """キー入力1つ分のINPUT構造体を作成する"""
+    return _INPUT(type=INPUT_KEYBOARD, union=_INPUT_UNION(ki=_KEYBDINPUT(wVk=vk, dwFlags=flags)))
+
+# Ctrl+Vの押下と解放（SendInputで1回にまとめて送る）
+_PASTE_INPUTS = (_INPUT * 4)(
+    _key_input(win32con.VK_CONTROL),  # Ctrlキーを押す
+    _key_input(ord('V')),  # Vキーを押す
+    _key_input(ord('V'), win32con.KEYEVENTF_KEYUP),  # Vキーを離す
+    _key_input(win32con.VK_CONTROL, win32con.KEYEVENTF_KEYUP),  # Ctrlキーを離す
+)
+
+# 直前にコピーしたテキストと、その時点のクリップボードのシーケンス番号
+_last_copied = None
+_last_sequence = None
+
 def copy_to_clipboard(text):
     """テキストをクリップボードにコピーし、可能であれば自動ペーストを試みる"""
+    global _last_copied, _last_sequence
     try:
-        # クリップボードを開く
-        win32clipboard.OpenClipboard()
-        # クリップボードをクリア
-        win32clipboard.EmptyClipboard()
-        # テキストを設定
-        win32clipboard.SetClipboardText(text, win32con.CF_UNICODETEXT)
-        # クリップボードを閉じる
-        win32clipboard.CloseClipboard()
+        # 直前にコピーしたテキストがそのまま残っている場合は書き込みを省く
+        # （シーケンス番号が変わっていれば、他のアプリケーションがクリップボードを変更している）
+        if text != _last_copied or win32clipboard.GetClipboardSequenceNumber() != _last_sequence:
+            # クリップボードを開く
+            win32clipboard.OpenClipboard()
+            try:
+                # クリップボードをクリア
+                win32clipboard.EmptyClipboard()
+                # テキストを設定
+                win32clipboard.SetClipboardText(text, win32con.CF_UNICODETEXT)
+            finally:
+                # クリップボードを閉じる
+                win32clipboard.CloseClipboard()
+            _last_copied = text
+            _last_sequence = win32clipboard.GetClipboardSequenceNumber()
         
         # 自動ペーストを試みる
         try_auto_paste()
@@ -33,13 +87,11 @@ def try_auto_paste():
         # 現在のアクティブウィンドウを取得
         hwnd = win32gui.GetForegroundWindow()
         if hwnd:
-            # Ctrl+Vを送信
-            win32api.keybd_event(win32con.VK_CONTROL, 0, 0, 0)  # Ctrlキーを押す
-            win32api.keybd_event(ord('V'), 0, 0, 0)  # Vキーを押す
-            time.sleep(0.1)  # 少し待機
-            win32api.keybd_event(ord('V'), 0, win32con.KEYEVENTF_KEYUP, 0)  # Vキーを離す
-            win32api.keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)  # Ctrlキーを離す
+            # Ctrl+Vを送信（押下から解放までを1回の呼び出しで入力キューに積むため、待機は不要）
+            count = len(_PASTE_INPUTS)
+            if _user32.SendInput(count, _PASTE_INPUTS, ctypes.sizeof(_INPUT)) != count:
+                raise ctypes.WinError(ctypes.get_last_error())
             logger.info("自動ペーストを実行しました")
     except Exception as e:
         logger.warning(f"自動ペーストに失敗しました: {str(e)}")
-        # エラーは無視して続行（自動ペーストは補助機能のため） 
\ No newline at end of file
+        # エラーは無視して続行（自動ペーストは補助機能のため）
@@ -1,12 +1,16 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from pathlib import Path
 
 class Logger:
     _instance = None
     _initialized = False
+    # ハンドラーを設定済みのロガー名
+    _configured_loggers = set()
 
     def __new__(cls, app_name: str):
         if cls._instance is None:
@@ -39,11 +43,19 @@ class Logger:
 
         # 通常ログの設定
         file_handler = self._create_file_handler(log_file, formatter, logging.INFO)
-        self.handlers.append(file_handler)
 
         # エラーログの設定
         error_handler = self._create_file_handler(error_log_file, formatter, logging.ERROR)
-        self.handlers.append(error_handler)
+
+        # ファイルへの書き込みはバックグラウンドのスレッドで行う
+        # （ロガーはキューに積むだけで、呼び出し元のスレッドをディスクI/Oで待たせない）
+        log_queue = queue.SimpleQueue()
+        self.listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.listener.stop)
+        self.handlers.append(logging.handlers.QueueHandler(log_queue))
 
         # コンソール出力の設定
         console_handler = logging.StreamHandler()
@@ -67,6 +79,10 @@ class Logger:
     def get_logger(name: str) -> logging.Logger:
         """指定された名前のロガーを取得"""
         logger = logging.getLogger(name)
+        # 設定済みのロガーはハンドラーを付け直さずにそのまま返す
+        if name in Logger._configured_loggers:
+            return logger
+        
         logger.setLevel(logging.DEBUG)
         
         # 既存のハンドラーをクリア
@@ -77,5 +93,6 @@ class Logger:
         if Logger._instance:
             for handler in Logger._instance.handlers:
                 logger.addHandler(handler)
+            Logger._configured_loggers.add(name)
         
         return logger 
\ No newline at end of file
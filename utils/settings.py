@@ -4,9 +4,18 @@ from pathlib import Path
 from utils.logger import Logger
 from PySide6.QtCore import QSettings, QPoint, QSize
 
+try:
+    import orjson
+except ImportError:  # orjsonが無い環境では標準のjsonで代替
+    orjson = None
+
 class Settings:
     """設定を管理するクラス"""
     
+    # 読み込んだ設定ファイルの内容と更新時刻（インスタンス間で共有し、ファイルが変わるまで再読み込みしない）
+    _cached_settings = None
+    _cached_mtime = None
+    
     def __init__(self):
         """設定の初期化"""
         self.logger = Logger("speech_to_text").get_logger(__name__)
@@ -24,14 +33,26 @@ class Settings:
         }
         
         try:
-            if self.settings_file.exists():
-                with open(self.settings_file, "r", encoding="utf-8") as f:
-                    settings = json.load(f)
-                    # デフォルト設定とマージ（新しい設定項目の追加に対応）
-                    return {**default_settings, **settings}
+            try:
+                mtime = self.settings_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                mtime = None
+            if mtime is not None:
+                if Settings._cached_mtime == mtime:
+                    return dict(Settings._cached_settings)
+                if orjson is not None:
+                    settings = orjson.loads(self.settings_file.read_bytes())
+                else:
+                    with open(self.settings_file, "r", encoding="utf-8") as f:
+                        settings = json.load(f)
+                # デフォルト設定とマージ（新しい設定項目の追加に対応）
+                settings = {**default_settings, **settings}
+                Settings._cached_settings = dict(settings)
+                Settings._cached_mtime = mtime
+                return settings
             else:
-                # 設定ファイルが存在しない場合はデフォルト設定を保存
-                self._save_settings(default_settings)
+                # 設定ファイルが存在しない場合はデフォルト設定を使う
+                # （ファイルは最初に設定を保存する時に作成される）
                 return default_settings
         except Exception as e:
             self.logger.error(f"設定の読み込みに失敗しました: {str(e)}")
@@ -43,8 +64,16 @@ class Settings:
             # 設定ディレクトリが存在しない場合は作成
             self.settings_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.settings_file, "w", encoding="utf-8") as f:
-                json.dump(settings, f, indent=4, ensure_ascii=False)
+            if orjson is not None:
+                with open(self.settings_file, "wb") as f:
+                    f.write(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.settings_file, "w", encoding="utf-8") as f:
+                    json.dump(settings, f, indent=4, ensure_ascii=False)
+            
+            # 書き込んだ内容をキャッシュに反映
+            Settings._cached_settings = dict(settings)
+            Settings._cached_mtime = self.settings_file.stat().st_mtime_ns
         except Exception as e:
             self.logger.error(f"設定の保存に失敗しました: {str(e)}")
     
@@ -67,9 +96,24 @@ class Settings:
             key (str): 設定のキー
             value: 保存する値
         """
+        # 値が変わらない場合はファイルに書き込まない
+        if key in self.settings and self.settings[key] == value:
+            return
         self.settings[key] = value
         self._save_settings(self.settings)
     
+    def update(self, values):
+        """複数の設定値をまとめて保存する（ファイルへの書き込みは1回だけ）
+
+        Args:
+            values (dict): 設定のキーと値の辞書
+        """
+        # すべての値が保存済みの値と同じ場合はファイルに書き込まない
+        if all(key in self.settings and self.settings[key] == value for key, value in values.items()):
+            return
+        self.settings.update(values)
+        self._save_settings(self.settings)
+    
     def get_all(self):
         """すべての設定を取得する"""
         return self.settings.copy()